@@ -1,6 +1,16 @@
 from importlib.metadata import version
 
 from .client import GmailClient, GmailAPIError
+from .async_client import AsyncGmailClient
+from .refs import DraftRef, LabelRef, MessageRef
 
 __version__ = version("gmail-sdk-ldraney")
-__all__ = ["GmailClient", "GmailAPIError", "__version__"]
+__all__ = [
+    "GmailClient",
+    "AsyncGmailClient",
+    "GmailAPIError",
+    "MessageRef",
+    "DraftRef",
+    "LabelRef",
+    "__version__",
+]
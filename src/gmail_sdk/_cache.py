@@ -0,0 +1,62 @@
+"""Conditional-GET (ETag) response cache shared by the sync and async clients."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import httpx
+
+from . import _json
+
+
+class _Entry(NamedTuple):
+    etag: str
+    body: bytes
+    immutable: bool
+
+
+class ETagCache:
+    """Bounded LRU of raw GET response bodies keyed by path and params.
+
+    Bodies are kept as bytes and parsed on every hit, so callers can mutate
+    the returned dicts without corrupting the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any] | None) -> tuple:
+        """Build a hashable key; list-valued params become tuples."""
+        if not params:
+            return (path,)
+        return (path, *sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+    def get(self, key: tuple) -> _Entry | None:
+        """Return the cached entry for key, marking it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = self._entries.pop(key, entry)
+        return entry
+
+    @staticmethod
+    def load(entry: _Entry) -> dict[str, Any]:
+        """Parse a cached body into a fresh dict."""
+        return _json.loads(entry.body)
+
+    def resolve(self, key: tuple, entry: _Entry | None, resp: httpx.Response) -> dict[str, Any]:
+        """Turn a (possibly 304) response into a body, storing new ETagged bodies."""
+        if resp.status_code == 304 and entry is not None:
+            return self.load(entry)
+        etag = resp.headers.get("ETag")
+        if etag and resp.content:
+            immutable = "immutable" in resp.headers.get("Cache-Control", "")
+            self._entries[key] = _Entry(etag, resp.content, immutable)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return _json.loads(resp.content) if resp.content else {}
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,86 @@
+"""JSON helpers that use orjson when it is installed.
+
+Install the ``fast`` extra to get orjson; otherwise the stdlib json module is used.
+Streaming item parsing needs ijson, from the ``stream`` extra.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+if orjson is not None:
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes with sorted keys."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+else:
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes with sorted keys."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+def request_kwargs(body: Any) -> dict[str, Any]:
+    """httpx keyword arguments that send body as a JSON request.
+
+    Serializes with :func:`dumps` instead of httpx's ``json=``, which always
+    goes through the stdlib encoder. Pre-serialized bytes are sent as-is.
+    """
+    if body is None:
+        return {}
+    if not isinstance(body, bytes):
+        body = dumps(body)
+    return {"content": body, "headers": {"Content-Type": "application/json"}}
+
+
+def _items_parser(prefix: str) -> tuple[Any, list[Any]]:
+    """Return an ijson push parser for prefix and the list it appends items to."""
+    try:
+        import ijson
+    except ImportError as exc:
+        raise ImportError("streaming JSON parsing requires ijson: pip install 'gmail-sdk-ldraney[stream]'") from exc
+    found = ijson.sendable_list()
+    return ijson.items_coro(found, prefix, use_float=True), found
+
+
+def iter_items(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    """Yield the values at an ijson prefix (e.g. "messages.item") from a chunked JSON document.
+
+    Only the current item is held in memory, never the whole document.
+    """
+    parser, found = _items_parser(prefix)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from found
+        found.clear()
+    parser.close()
+    yield from found
+
+
+async def aiter_items(chunks: AsyncIterable[bytes], prefix: str) -> AsyncIterator[Any]:
+    """Async version of :func:`iter_items`."""
+    parser, found = _items_parser(prefix)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in found:
+            yield item
+        found.clear()
+    parser.close()
+    for item in found:
+        yield item
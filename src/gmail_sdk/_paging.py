@@ -0,0 +1,30 @@
+"""Pagination helpers shared by the async mixins."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+
+async def aiter_pages(
+    fetch_page: Callable[[str | None], Awaitable[dict[str, Any]]],
+    key: str,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every item under ``key`` across all pages.
+
+    The request for page N+1 is started as soon as page N's ``nextPageToken``
+    is known, so it runs while the caller consumes page N's items. Only one
+    page can be in flight because each token comes from the previous page.
+    """
+    pending: asyncio.Future[dict[str, Any]] | None = asyncio.ensure_future(fetch_page(None))
+    try:
+        while pending is not None:
+            page = await pending
+            token = page.get("nextPageToken")
+            pending = asyncio.ensure_future(fetch_page(token)) if token else None
+            for item in page.get(key, []):
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,170 @@
+"""Async Gmail API client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from . import _json
+from ._cache import ETagCache
+from .auth import AuthMixin
+from .client import DEFAULT_HEADERS, DEFAULT_SECRETS_DIR, DEFAULT_TIMEOUT, GMAIL_BASE, GmailClient
+from .messages import AsyncMessagesMixin
+from .threads import AsyncThreadsMixin, ThreadCache
+from .drafts import AsyncDraftsMixin
+from .labels import AsyncLabelsMixin
+from .history import AsyncHistoryMixin
+from .convenience import AsyncConvenienceMixin
+from .batch import AsyncBatchMixin
+
+# Async callers fan out far wider than sync ones (see gather_get_messages),
+# so allow a much larger pool than DEFAULT_LIMITS.
+ASYNC_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=300.0)
+
+
+class AsyncGmailClient(
+    AuthMixin,
+    AsyncMessagesMixin,
+    AsyncThreadsMixin,
+    AsyncDraftsMixin,
+    AsyncLabelsMixin,
+    AsyncHistoryMixin,
+    AsyncConvenienceMixin,
+    AsyncBatchMixin,
+):
+    """Asynchronous Python client for the Gmail REST API.
+
+    Mirrors :class:`GmailClient` with ``async def`` methods backed by a shared
+    ``httpx.AsyncClient``, so many calls can be overlapped with
+    ``asyncio.gather``. Token loading happens synchronously at construction,
+    exactly as in :class:`GmailClient`.
+    """
+
+    __slots__ = GmailClient.__slots__
+
+    def __init__(
+        self,
+        account: str | None = None,
+        access_token: str | None = None,
+        secrets_dir: str | None = None,
+        lazy_refresh: bool = False,
+        etag_cache_size: int = 0,
+    ):
+        self.account = account
+        self.secrets_dir = secrets_dir or os.environ.get("GMAIL_SECRETS_DIR", DEFAULT_SECRETS_DIR)
+
+        if access_token is None and account is not None:
+            if lazy_refresh:
+                access_token = self._load_token_no_refresh(account, self.secrets_dir)
+            else:
+                access_token = self._load_and_refresh_token(account, self.secrets_dir)
+
+        self.access_token = access_token
+        self._etag_cache = ETagCache(etag_cache_size) if etag_cache_size > 0 else None
+        self._thread_cache: ThreadCache = OrderedDict()
+        self._my_email = None
+        self._http = httpx.AsyncClient(
+            base_url=GMAIL_BASE,
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=ASYNC_LIMITS,
+            headers=DEFAULT_HEADERS,
+        )
+        if access_token:
+            self._apply_token(access_token)
+
+    # ---- low-level helpers ------------------------------------------------
+
+    _raise_api_error = staticmethod(GmailClient._raise_api_error)
+    _decode = staticmethod(GmailClient._decode)
+    _apply_token = GmailClient._apply_token
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, refreshing the token and retrying once on 401."""
+        resp = await self._http.request(method, path, **kwargs)
+        if resp.status_code == 401 and self.account is not None:
+            await self._refresh_now()
+            resp = await self._http.request(method, path, **kwargs)
+        if not resp.is_success and resp.status_code != 304:
+            self._raise_api_error(resp)
+        return resp
+
+    @asynccontextmanager
+    async def _stream(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Like _request, but leaves the body unread for incremental consumption."""
+        for attempt in range(2):
+            async with self._http.stream(method, path, **kwargs) as resp:
+                if resp.status_code != 401 or self.account is None or attempt:
+                    if not resp.is_success:
+                        await resp.aread()
+                        self._raise_api_error(resp)
+                    yield resp
+                    return
+            await self._refresh_now()
+
+    async def _refresh_now(self) -> None:
+        """Replace the current access token with a freshly refreshed one."""
+        token = await asyncio.to_thread(
+            self._load_and_refresh_token,
+            self.account,
+            self.secrets_dir,
+            stale_token=self.access_token,
+        )
+        self._apply_token(token)
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        cache = self._etag_cache
+        if cache is None:
+            return self._decode(await self._request("GET", path, params=params))
+        key = cache.key(path, params)
+        entry = cache.get(key)
+        if entry is not None and entry.immutable:
+            return cache.load(entry)
+        headers = {"If-None-Match": entry.etag} if entry is not None else None
+        resp = await self._request("GET", path, params=params, headers=headers)
+        return cache.resolve(key, entry, resp)
+
+    async def _post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        resp = await self._request("POST", path, **_json.request_kwargs(json))
+        return self._decode(resp)
+
+    async def _post_status(self, path: str, json: dict[str, Any] | None = None) -> int:
+        resp = await self._request("POST", path, **_json.request_kwargs(json))
+        return resp.status_code
+
+    async def _delete(self, path: str) -> int:
+        resp = await self._request("DELETE", path)
+        return resp.status_code
+
+    async def _patch(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        resp = await self._request("PATCH", path, **_json.request_kwargs(json))
+        return self._decode(resp)
+
+    async def _put(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        resp = await self._request("PUT", path, **_json.request_kwargs(json))
+        return self._decode(resp)
+
+    def __repr__(self) -> str:
+        if self.account:
+            return f"AsyncGmailClient(account={self.account!r})"
+        return "AsyncGmailClient()"
+
+    async def __aenter__(self) -> AsyncGmailClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP/2 connection pool."""
+        await self._http.aclose()
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
+import tempfile
+import threading
 import time
 import webbrowser
+from collections import defaultdict
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -16,6 +19,8 @@ if TYPE_CHECKING:
 
 import httpx
 
+from . import _json
+
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 REDIRECT_URI = "http://localhost:8090"
@@ -28,6 +33,60 @@ SCOPES = [
 ]
 
 
+def _refresh_skew_from_env(default: int = 60) -> int:
+    """Read GMAIL_TOKEN_REFRESH_SKEW, falling back to default if unset or malformed."""
+    try:
+        return int(os.environ.get("GMAIL_TOKEN_REFRESH_SKEW", default))
+    except ValueError:
+        return default
+
+
+# Seconds before expiry at which a token is treated as expired and refreshed.
+REFRESH_SKEW = _refresh_skew_from_env()
+
+# Shared HTTP/2 client for the token endpoint, created on first use so the
+# TLS session is reused across refreshes instead of renegotiated each time.
+_TOKEN_HTTP: httpx.Client | None = None
+_TOKEN_HTTP_LOCK = threading.Lock()
+
+
+def _token_http() -> httpx.Client:
+    """Return the shared token-endpoint client, creating it if needed."""
+    global _TOKEN_HTTP
+    with _TOKEN_HTTP_LOCK:
+        if _TOKEN_HTTP is None:
+            _TOKEN_HTTP = httpx.Client(http2=True, timeout=30.0)
+            atexit.register(_TOKEN_HTTP.close)
+        return _TOKEN_HTTP
+
+
+# Process-wide cache of parsed token files, keyed by (secrets_dir, account).
+_TOKEN_MEM_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+_TOKEN_MEM_LOCK = threading.Lock()
+
+# Client config from credentials.json keyed by real path, with the mtime it was read at.
+_CRED_CACHE: dict[str, tuple[float, dict[str, str]]] = {}
+
+# Last serialized contents written per token path, so unchanged tokens are not rewritten.
+_LAST_WRITTEN: dict[str, bytes] = {}
+
+# One lock per (secrets_dir, account) so concurrent clients refresh only once.
+_REFRESH_LOCKS: defaultdict[tuple[str, str], threading.Lock] = defaultdict(threading.Lock)
+
+
+def _cached_access_token(key: tuple[str, str], stale_token: str | None = None) -> str | None:
+    """Return the in-memory access token for key if it is not about to expire."""
+    with _TOKEN_MEM_LOCK:
+        token_data = _TOKEN_MEM_CACHE.get(key)
+    if (
+        token_data is not None
+        and token_data["access_token"] != stale_token
+        and token_data.get("expires_at", 0) > time.time() + REFRESH_SKEW
+    ):
+        return token_data["access_token"]
+    return None
+
+
 class AuthMixin:
     """Mixin providing OAuth authentication methods."""
 
@@ -78,7 +137,7 @@ class AuthMixin:
         Returns:
             Token data dict with access_token, refresh_token, expires_at, etc.
         """
-        resp = httpx.post(
+        resp = _token_http().post(
             GOOGLE_TOKEN_URL,
             data={
                 "client_id": client_id,
@@ -109,7 +168,7 @@ class AuthMixin:
         Returns:
             Updated token fields (access_token, expires_at, etc).
         """
-        resp = httpx.post(
+        resp = _token_http().post(
             GOOGLE_TOKEN_URL,
             data={
                 "client_id": client_id,
@@ -125,14 +184,24 @@ class AuthMixin:
 
     @staticmethod
     def _load_credentials(secrets_dir: str) -> dict[str, str]:
-        """Load OAuth client credentials from credentials.json."""
+        """Load OAuth client credentials from credentials.json.
+
+        The selected application config is memoized until the file's mtime
+        changes, so every caller shares the same dict.
+        """
         creds_path = os.path.join(secrets_dir, "credentials.json")
-        with open(creds_path) as f:
-            data = json.load(f)
-        if "installed" in data:
-            return data["installed"]
-        if "web" in data:
-            return data["web"]
+        key = os.path.realpath(creds_path)
+        mtime = os.stat(creds_path).st_mtime
+        cached = _CRED_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(creds_path, "rb") as f:
+            data = _json.loads(f.read())
+        config = data.get("installed") or data.get("web")
+        if config is not None:
+            _CRED_CACHE[key] = (mtime, config)
+            return config
         raise ValueError("credentials.json must contain an 'installed' or 'web' application config")
 
     @staticmethod
@@ -140,44 +209,118 @@ class AuthMixin:
         """Load a saved token file for an account."""
         token_path = Path(secrets_dir) / f"gmail-{account}.json"
         if token_path.exists():
-            with open(token_path) as f:
-                return json.load(f)
+            with open(token_path, "rb") as f:
+                return _json.loads(f.read())
         return None
 
     @staticmethod
     def _save_token(account: str, secrets_dir: str, token_data: dict[str, Any]) -> None:
-        """Save token data to disk with restricted permissions."""
+        """Save token data to disk with restricted permissions.
+
+        The data goes to a 0o600 temp file that is then renamed over the
+        token file, so readers never see a partial write and the file never
+        exists with looser permissions. The write is skipped when the file
+        already holds exactly this data.
+        """
         token_path = Path(secrets_dir) / f"gmail-{account}.json"
-        fd = os.open(str(token_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        os.fchmod(fd, 0o600)
-        with os.fdopen(fd, "w") as f:
-            json.dump(token_data, f, indent=2)
+        serialized = _json.dumps(token_data)
+        if _LAST_WRITTEN.get(str(token_path)) == serialized and token_path.exists():
+            return
+        # mkstemp creates the file with mode 0o600
+        fd, tmp_path = tempfile.mkstemp(dir=secrets_dir, prefix=f".gmail-{account}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(serialized)
+        try:
+            os.replace(tmp_path, token_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        _LAST_WRITTEN[str(token_path)] = serialized
 
     @classmethod
-    def _load_and_refresh_token(cls, account: str, secrets_dir: str) -> str:
-        """Load token for account, refreshing if expired. Returns access_token."""
-        token_data = cls._load_token(account, secrets_dir)
+    def clear_token_cache(cls) -> None:
+        """Drop all in-memory tokens so the next client reloads from disk."""
+        with _TOKEN_MEM_LOCK:
+            _TOKEN_MEM_CACHE.clear()
+
+    @classmethod
+    def _load_token_no_refresh(cls, account: str, secrets_dir: str) -> str:
+        """Return the stored access_token for account without checking expiry.
+
+        Used with lazy refresh: an expired token is only refreshed once the
+        API rejects it with a 401.
+        """
+        with _TOKEN_MEM_LOCK:
+            token_data = _TOKEN_MEM_CACHE.get((secrets_dir, account))
+        if token_data is None:
+            token_data = cls._load_token(account, secrets_dir)
         if token_data is None:
             raise FileNotFoundError(
                 f"No token file for account '{account}'. "
                 f"Run GmailClient.authorize(account='{account}') first."
             )
+        return token_data["access_token"]
 
-        if token_data.get("expires_at", 0) < time.time() + 300:
-            creds = cls._load_credentials(secrets_dir)
-            new_data = cls.refresh_access_token(
-                client_id=creds["client_id"],
-                client_secret=creds["client_secret"],
-                refresh_token=token_data["refresh_token"],
-            )
-            # Preserve refresh_token (not always returned on refresh)
-            token_data["access_token"] = new_data["access_token"]
-            token_data["expires_at"] = new_data["expires_at"]
-            if "refresh_token" in new_data:
-                token_data["refresh_token"] = new_data["refresh_token"]
-            cls._save_token(account, secrets_dir, token_data)
+    @classmethod
+    def _load_and_refresh_token(
+        cls,
+        account: str,
+        secrets_dir: str,
+        stale_token: str | None = None,
+    ) -> str:
+        """Load token for account, refreshing if expired. Returns access_token.
 
-        return token_data["access_token"]
+        A fresh token already seen by this process is served from memory
+        without touching the token file. Refreshes are serialized per account,
+        so concurrent callers share a single token-endpoint round trip.
+
+        Args:
+            account: Account alias.
+            secrets_dir: Directory holding the token file.
+            stale_token: An access token the API has rejected. It is treated
+                as expired even if its recorded expiry is still in the future.
+        """
+        key = (secrets_dir, account)
+        access_token = _cached_access_token(key, stale_token)
+        if access_token is not None:
+            return access_token
+
+        with _TOKEN_MEM_LOCK:
+            refresh_lock = _REFRESH_LOCKS[key]
+
+        with refresh_lock:
+            # Another caller may have refreshed while we waited for the lock.
+            access_token = _cached_access_token(key, stale_token)
+            if access_token is not None:
+                return access_token
+
+            token_data = cls._load_token(account, secrets_dir)
+            if token_data is None:
+                raise FileNotFoundError(
+                    f"No token file for account '{account}'. "
+                    f"Run GmailClient.authorize(account='{account}') first."
+                )
+
+            if (
+                token_data["access_token"] == stale_token
+                or token_data.get("expires_at", 0) < time.time() + REFRESH_SKEW
+            ):
+                creds = cls._load_credentials(secrets_dir)
+                new_data = cls.refresh_access_token(
+                    client_id=creds["client_id"],
+                    client_secret=creds["client_secret"],
+                    refresh_token=token_data["refresh_token"],
+                )
+                # Preserve refresh_token (not always returned on refresh)
+                token_data["access_token"] = new_data["access_token"]
+                token_data["expires_at"] = new_data["expires_at"]
+                if "refresh_token" in new_data:
+                    token_data["refresh_token"] = new_data["refresh_token"]
+                cls._save_token(account, secrets_dir, token_data)
+
+            with _TOKEN_MEM_LOCK:
+                _TOKEN_MEM_CACHE[key] = token_data
+            return token_data["access_token"]
 
     @classmethod
     def authorize(
@@ -199,8 +342,6 @@ class AuthMixin:
         secrets_dir = secrets_dir or os.environ.get("GMAIL_SECRETS_DIR", DEFAULT_SECRETS_DIR)
         creds = cls._load_credentials(secrets_dir)
 
-        auth_url = cls.get_auth_url(client_id=creds["client_id"])
-
         # Capture the auth code via a local HTTP server
         auth_code = None
 
@@ -217,7 +358,10 @@ class AuthMixin:
             def log_message(self, format, *args):
                 pass
 
-        server = HTTPServer(("localhost", 8090), _Handler)
+        # Bind an ephemeral port so a busy port (or a concurrent authorize) can't block the flow
+        server = HTTPServer(("localhost", 0), _Handler)
+        redirect_uri = f"http://localhost:{server.server_address[1]}"
+        auth_url = cls.get_auth_url(client_id=creds["client_id"], redirect_uri=redirect_uri)
         webbrowser.open(auth_url)
         server.handle_request()
         server.server_close()
@@ -229,8 +373,11 @@ class AuthMixin:
             code=auth_code,
             client_id=creds["client_id"],
             client_secret=creds["client_secret"],
+            redirect_uri=redirect_uri,
         )
         cls._save_token(account, secrets_dir, token_data)
+        with _TOKEN_MEM_LOCK:
+            _TOKEN_MEM_CACHE[(secrets_dir, account)] = token_data
 
         from .client import GmailClient
         return GmailClient(account=account, secrets_dir=secrets_dir)
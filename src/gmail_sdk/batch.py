@@ -0,0 +1,161 @@
+"""Batch operations over Gmail's multipart/mixed batch endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from email.parser import BytesParser
+from typing import Any
+
+from . import _json
+from .errors import GmailAPIError
+
+BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+# Gmail accepts up to 100 calls per batch but recommends 50 to avoid rate limiting.
+BATCH_LIMIT = 50
+# Requests in flight at once when the async client falls back to individual calls.
+FALLBACK_CONCURRENCY = 10
+
+# (method, path, json body) — path is relative to /gmail/v1 and may carry a query string.
+# The body may also be pre-serialized JSON bytes, so one payload can be shared by many calls.
+BatchRequest = tuple[str, str, dict[str, Any] | bytes | None]
+
+
+def build_batch_body(requests: list[BatchRequest], boundary: str) -> bytes:
+    """Encode sub-requests as a multipart/mixed batch body."""
+    chunks: list[bytes] = []
+    for i, (method, path, body) in enumerate(requests):
+        chunks.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"{method} /gmail/v1{path} HTTP/1.1\r\n".encode()
+        )
+        if body is not None:
+            payload = body if isinstance(body, bytes) else _json.dumps(body)
+            chunks.append(
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n\r\n".encode()
+            )
+            chunks.append(payload)
+        chunks.append(b"\r\n")
+    chunks.append(f"--{boundary}--\r\n".encode())
+    return b"".join(chunks)
+
+
+def parse_batch_response(content: bytes, content_type: str, count: int) -> list[dict[str, Any]]:
+    """Decode a multipart/mixed batch response into per-request bodies, in request order.
+
+    Failed sub-requests are returned as Gmail's error body (``{"error": {...}}``).
+    """
+    envelope = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + content
+    )
+    results: list[dict[str, Any]] = [{} for _ in range(count)]
+    for position, part in enumerate(envelope.get_payload()):
+        content_id = (part["Content-ID"] or "").strip("<>")
+        index = int(content_id.rsplit("item", 1)[1]) if "item" in content_id else position
+
+        inner = part.get_payload(decode=True).replace(b"\r\n", b"\n")
+        head, _, body = inner.partition(b"\n\n")
+        status_code = int(head.split(None, 2)[1])
+        body = body.strip()
+        if body:
+            try:
+                results[index] = _json.loads(body)
+            except ValueError:
+                results[index] = {"error": {"code": status_code, "message": body.decode(errors="replace")}}
+        elif status_code >= 400:
+            results[index] = {"error": {"code": status_code, "message": head.decode(errors="replace")}}
+    return results
+
+
+class BatchMixin:
+    """Mixin providing Gmail batch request support."""
+
+    def batch_execute(self, requests: list[BatchRequest]) -> list[dict[str, Any]]:
+        """POST /batch/gmail/v1 — Run many API calls in as few HTTP round trips as possible.
+
+        Requests are sent BATCH_LIMIT (50) per multipart/mixed POST.
+
+        Args:
+            requests: ``(method, path, json_body)`` tuples, e.g.
+                ``("GET", "/users/me/messages/abc?format=metadata", None)``.
+
+        Returns:
+            One parsed response body per request, in order. A failed
+            sub-request yields Gmail's error body (``{"error": {...}}``)
+            rather than raising, so one bad ID does not sink the batch.
+
+        If the batch endpoint itself answers 5xx, that chunk is retried as
+        individual requests.
+        """
+        results: list[dict[str, Any]] = []
+        for i in range(0, len(requests), BATCH_LIMIT):
+            chunk = requests[i:i + BATCH_LIMIT]
+            boundary = f"batch_{uuid.uuid4().hex}"
+            try:
+                resp = self._request(
+                    "POST",
+                    BATCH_URL,
+                    content=build_batch_body(chunk, boundary),
+                    headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                )
+            except GmailAPIError as exc:
+                if exc.status_code < 500:
+                    raise
+                results.extend(self._execute_individually(chunk))
+                continue
+            results.extend(parse_batch_response(resp.content, resp.headers["Content-Type"], len(chunk)))
+        return results
+
+    def _execute_individually(self, requests: list[BatchRequest]) -> list[dict[str, Any]]:
+        """Run batch sub-requests one by one, mapping errors to batch-style bodies."""
+        results: list[dict[str, Any]] = []
+        for method, path, body in requests:
+            try:
+                results.append(self._decode(self._request(method, path, **_json.request_kwargs(body))))
+            except GmailAPIError as exc:
+                results.append({"error": {"code": exc.status_code, "message": exc.message}})
+        return results
+
+
+class AsyncBatchMixin:
+    """Async counterpart of :class:`BatchMixin`."""
+
+    async def batch_execute(self, requests: list[BatchRequest]) -> list[dict[str, Any]]:
+        """Async version of :meth:`BatchMixin.batch_execute`."""
+        results: list[dict[str, Any]] = []
+        for i in range(0, len(requests), BATCH_LIMIT):
+            chunk = requests[i:i + BATCH_LIMIT]
+            boundary = f"batch_{uuid.uuid4().hex}"
+            try:
+                resp = await self._request(
+                    "POST",
+                    BATCH_URL,
+                    content=build_batch_body(chunk, boundary),
+                    headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                )
+            except GmailAPIError as exc:
+                if exc.status_code < 500:
+                    raise
+                results.extend(await self._execute_individually(chunk))
+                continue
+            results.extend(parse_batch_response(resp.content, resp.headers["Content-Type"], len(chunk)))
+        return results
+
+    async def _execute_individually(self, requests: list[BatchRequest]) -> list[dict[str, Any]]:
+        """Run batch sub-requests concurrently, at most FALLBACK_CONCURRENCY in flight.
+
+        Results keep the order of requests; errors become batch-style bodies.
+        """
+        sem = asyncio.Semaphore(FALLBACK_CONCURRENCY)
+
+        async def _one(method: str, path: str, body: dict[str, Any] | bytes | None) -> dict[str, Any]:
+            async with sem:
+                try:
+                    return self._decode(await self._request(method, path, **_json.request_kwargs(body)))
+                except GmailAPIError as exc:
+                    return {"error": {"code": exc.status_code, "message": exc.message}}
+
+        return list(await asyncio.gather(*(_one(*request) for request in requests)))
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib.metadata import version
 from typing import Any
 
 import httpx
 
+from . import _json
+from ._cache import ETagCache
 from .auth import AuthMixin
+from .errors import GmailAPIError
 from .messages import MessagesMixin
-from .threads import ThreadsMixin
+from .threads import ThreadCache, ThreadsMixin
 from .drafts import DraftsMixin
 from .labels import LabelsMixin
 from .attachments import AttachmentsMixin
@@ -17,18 +25,22 @@ from .filters import FiltersMixin
 from .settings import SettingsMixin
 from .history import HistoryMixin
 from .convenience import ConvenienceMixin
+from .batch import BatchMixin
 
 GMAIL_BASE = "https://gmail.googleapis.com/gmail/v1"
 DEFAULT_SECRETS_DIR = os.path.join(os.path.expanduser("~"), "secrets", "google-oauth")
-
-
-class GmailAPIError(Exception):
-    """Exception wrapping Gmail API HTTP errors."""
-
-    def __init__(self, status_code: int, message: str) -> None:
-        self.status_code = status_code
-        self.message = message
-        super().__init__(f"Gmail API error {status_code}: {message}")
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    # Idle pooled connections are checked for server-side closure on reuse,
+    # so keeping them longer only saves handshakes between bursts of calls.
+    keepalive_expiry=300.0,
+)
+# Long reads for large messages, but give up quickly on a connect that stalls.
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+# Google APIs only gzip responses when the User-Agent also contains "gzip";
+# httpx already sends Accept-Encoding: gzip and decompresses transparently.
+DEFAULT_HEADERS = {"User-Agent": f"gmail-sdk-ldraney/{version('gmail-sdk-ldraney')} (gzip)"}
 
 
 class GmailClient(
@@ -42,37 +54,65 @@ class GmailClient(
     SettingsMixin,
     HistoryMixin,
     ConvenienceMixin,
+    BatchMixin,
 ):
     """Synchronous Python client for the Gmail REST API.
 
     Either ``account`` or ``access_token`` must be provided. If neither is
     given, the client will be created without authentication and API calls
     will fail.
+
+    With ``lazy_refresh=True`` the stored token is used as-is and only
+    refreshed if the API rejects it, which saves a token-endpoint round trip
+    for short-lived scripts.
+
+    With ``etag_cache_size > 0`` up to that many GET responses are kept and
+    revalidated with ``If-None-Match``; an unchanged resource then comes back
+    as a bodyless 304.
+
+    With ``prewarm=True`` a background thread opens the pooled connection
+    (TCP, TLS and HTTP/2 setup) right away, so the first real call does not
+    pay for the handshake.
     """
 
+    # Fixed per-instance state lives in slots. The mixins define no __slots__,
+    # so instances still get a __dict__ (allocated only on first use) and
+    # methods can be patched per instance, e.g. in tests.
+    __slots__ = ("account", "secrets_dir", "access_token", "_etag_cache", "_thread_cache", "_http", "_my_email")
+
     def __init__(
         self,
         account: str | None = None,
         access_token: str | None = None,
         secrets_dir: str | None = None,
+        lazy_refresh: bool = False,
+        etag_cache_size: int = 0,
+        prewarm: bool = False,
     ):
         self.account = account
         self.secrets_dir = secrets_dir or os.environ.get("GMAIL_SECRETS_DIR", DEFAULT_SECRETS_DIR)
 
         if access_token is None and account is not None:
-            access_token = self._load_and_refresh_token(account, self.secrets_dir)
+            if lazy_refresh:
+                access_token = self._load_token_no_refresh(account, self.secrets_dir)
+            else:
+                access_token = self._load_and_refresh_token(account, self.secrets_dir)
 
         self.access_token = access_token
-
-        headers: dict[str, str] = {}
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-
+        self._etag_cache = ETagCache(etag_cache_size) if etag_cache_size > 0 else None
+        self._thread_cache: ThreadCache = OrderedDict()
+        self._my_email = None
         self._http = httpx.Client(
             base_url=GMAIL_BASE,
-            headers=headers,
-            timeout=60.0,
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            headers=DEFAULT_HEADERS,
         )
+        if access_token:
+            self._apply_token(access_token)
+        if prewarm:
+            threading.Thread(target=self._prewarm, daemon=True).start()
 
     # ---- low-level helpers ------------------------------------------------
 
@@ -88,34 +128,92 @@ class GmailClient(
                 detail = resp.text
             raise GmailAPIError(resp.status_code, detail) from exc
 
+    @staticmethod
+    def _decode(resp: httpx.Response) -> dict[str, Any]:
+        """Parse a successful response body, treating an empty body as {}."""
+        if resp.status_code == 204:
+            return {}
+        return _json.loads(resp.content) if resp.content else {}
+
+    def _prewarm(self) -> None:
+        """Open a pooled connection with a throwaway HEAD; the response is ignored."""
+        try:
+            self._http.head("/users/me/profile", timeout=5.0)
+        except (httpx.HTTPError, RuntimeError):
+            # Network trouble surfaces on the first real call; RuntimeError
+            # means the client was closed before the warm-up ran.
+            pass
+
+    def _apply_token(self, token: str) -> None:
+        """Set the access token and update the live Authorization header in place."""
+        self.access_token = token
+        self._http.headers["Authorization"] = f"Bearer {token}"
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, refreshing the token and retrying once on 401."""
+        resp = self._http.request(method, path, **kwargs)
+        if resp.status_code == 401 and self.account is not None:
+            self._refresh_now()
+            resp = self._http.request(method, path, **kwargs)
+        if not resp.is_success and resp.status_code != 304:
+            self._raise_api_error(resp)
+        return resp
+
+    @contextmanager
+    def _stream(self, method: str, path: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """Like _request, but leaves the body unread for incremental consumption."""
+        for attempt in range(2):
+            with self._http.stream(method, path, **kwargs) as resp:
+                if resp.status_code != 401 or self.account is None or attempt:
+                    if not resp.is_success:
+                        resp.read()
+                        self._raise_api_error(resp)
+                    yield resp
+                    return
+            self._refresh_now()
+
+    def _refresh_now(self) -> None:
+        """Replace the current access token with a freshly refreshed one."""
+        self._apply_token(
+            self._load_and_refresh_token(self.account, self.secrets_dir, stale_token=self.access_token)
+        )
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.get(path, params=params)
-        self._raise_api_error(resp)
-        return resp.json() if resp.content else {}
+        cache = self._etag_cache
+        if cache is None:
+            return self._decode(self._request("GET", path, params=params))
+        key = cache.key(path, params)
+        entry = cache.get(key)
+        if entry is not None and entry.immutable:
+            return cache.load(entry)
+        headers = {"If-None-Match": entry.etag} if entry is not None else None
+        resp = self._request("GET", path, params=params, headers=headers)
+        return cache.resolve(key, entry, resp)
 
     def _post(
         self,
         path: str,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        resp = self._http.post(path, json=json)
-        self._raise_api_error(resp)
-        return resp.json() if resp.content else {}
+        resp = self._request("POST", path, **_json.request_kwargs(json))
+        return self._decode(resp)
+
+    def _post_status(self, path: str, json: dict[str, Any] | None = None) -> int:
+        # For callers that discard the response: skip the JSON decode
+        resp = self._request("POST", path, **_json.request_kwargs(json))
+        return resp.status_code
 
     def _delete(self, path: str) -> int:
-        resp = self._http.delete(path)
-        self._raise_api_error(resp)
+        resp = self._request("DELETE", path)
         return resp.status_code
 
     def _patch(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.patch(path, json=json)
-        self._raise_api_error(resp)
-        return resp.json() if resp.content else {}
+        resp = self._request("PATCH", path, **_json.request_kwargs(json))
+        return self._decode(resp)
 
     def _put(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.put(path, json=json)
-        self._raise_api_error(resp)
-        return resp.json() if resp.content else {}
+        resp = self._request("PUT", path, **_json.request_kwargs(json))
+        return self._decode(resp)
 
     def __repr__(self) -> str:
         if self.account:
@@ -129,4 +227,5 @@ class GmailClient(
         self.close()
 
     def close(self) -> None:
+        """Close the underlying HTTP/2 connection pool."""
         self._http.close()
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from email.utils import getaddresses, parseaddr
 from typing import Any
 
-from .mime_utils import build_reply_message, build_forward_message
+from .mime_utils import _decode_b64url, build_reply_message, build_forward_message
 
 
 def _get_header(headers: list[dict[str, str]], name: str) -> str:
     """Extract a header value from a Gmail message headers list."""
+    name = name.lower()
     for h in headers:
-        if h["name"].lower() == name.lower():
+        if h["name"].lower() == name:
             return h["value"]
     return ""
 
 
+def _headers_to_dict(headers: list[dict[str, str]]) -> dict[str, str]:
+    """Index a Gmail message headers list by lowercased name.
+
+    Like _get_header, the first occurrence of a repeated header wins.
+    """
+    hdrs: dict[str, str] = {}
+    for h in headers:
+        hdrs.setdefault(h["name"].lower(), h["value"])
+    return hdrs
+
+
+@functools.lru_cache(maxsize=4096)
 def _extract_email(addr: str) -> str:
     """Extract the bare email address from a potentially display-name-wrapped address.
 
@@ -23,14 +38,114 @@ def _extract_email(addr: str) -> str:
         "alice@example.com" -> "alice@example.com"
         "Alice Smith <alice@example.com>" -> "alice@example.com"
         "<alice@example.com>" -> "alice@example.com"
+
+    Cached, since the same addresses recur across every message of a thread.
     """
     _, email = parseaddr(addr)
     return email.lower()
 
 
+_REPLY_HEADERS = ["From", "Subject", "Message-ID", "References", "Reply-To"]
+_REPLY_ALL_HEADERS = ["From", "To", "Cc", "Subject", "Message-ID", "References", "Reply-To"]
+# forward only needs the headers and body parts, not labels, snippet, sizes, etc.
+_FORWARD_FIELDS = "payload(mimeType,headers,body/data,parts)"
+
+
+def _build_reply(original: dict[str, Any], body: str) -> str:
+    """Build the raw reply to a message fetched with _REPLY_HEADERS."""
+    hdrs = _headers_to_dict(original.get("payload", {}).get("headers", []))
+
+    to = hdrs.get("reply-to") or hdrs.get("from", "")
+    subject = hdrs.get("subject", "")
+    if not subject.lower().startswith("re:"):
+        subject = f"Re: {subject}"
+    orig_message_id = hdrs.get("message-id", "")
+    references = hdrs.get("references", "")
+
+    return build_reply_message(
+        to=to,
+        subject=subject,
+        body=body,
+        message_id=orig_message_id,
+        references=references,
+    )
+
+
+def _build_reply_all(original: dict[str, Any], body: str, my_email: str) -> str:
+    """Build the raw reply-all to a message fetched with _REPLY_ALL_HEADERS.
+
+    ``my_email`` is excluded from the recipients.
+    """
+    hdrs = _headers_to_dict(original.get("payload", {}).get("headers", []))
+
+    reply_to = hdrs.get("reply-to") or hdrs.get("from", "")
+    orig_from = hdrs.get("from", "")
+    orig_to = hdrs.get("to", "")
+    orig_cc = hdrs.get("cc", "")
+    subject = hdrs.get("subject", "")
+    if not subject.lower().startswith("re:"):
+        subject = f"Re: {subject}"
+    orig_message_id = hdrs.get("message-id", "")
+    references = hdrs.get("references", "")
+
+    # Collect all recipients: reply-to/from goes in To, everyone else in Cc
+    # Use _extract_email to handle display names like "Alice <alice@example.com>"
+    seen_emails = set()
+    to_addr = reply_to
+    seen_emails.add(_extract_email(to_addr))
+
+    cc_addrs = []
+    all_headers = [h for h in [orig_from, orig_to, orig_cc] if h]
+    for display_name, email_addr in getaddresses(all_headers):
+        bare = email_addr.lower()
+        if bare and bare not in seen_emails and bare != my_email:
+            # Preserve display name if present
+            full = f"{display_name} <{email_addr}>" if display_name else email_addr
+            cc_addrs.append(full)
+            seen_emails.add(bare)
+
+    return build_reply_message(
+        to=to_addr,
+        subject=subject,
+        body=body,
+        message_id=orig_message_id,
+        references=references,
+        cc=", ".join(cc_addrs) if cc_addrs else None,
+    )
+
+
+def _build_forward(original: dict[str, Any], to: str, note: str | None) -> str:
+    """Build the raw forward of a message fetched in full format."""
+    hdrs = _headers_to_dict(original.get("payload", {}).get("headers", []))
+
+    subject = hdrs.get("subject", "")
+    if not subject.lower().startswith("fwd:"):
+        subject = f"Fwd: {subject}"
+
+    # Extract body from payload
+    original_body = ConvenienceMixin._extract_body(original.get("payload", {})) or "(no text body found)"
+
+    return build_forward_message(
+        to=to,
+        subject=subject,
+        original_body=original_body,
+        note=note,
+    )
+
+
 class ConvenienceMixin:
     """Mixin providing high-level convenience methods."""
 
+    def _get_my_email(self) -> str:
+        """Return the authenticated user's lowercased address, fetching it once.
+
+        The address is cached in ``_my_email``, which the client declares as a
+        slot and initializes to None.
+        """
+        if self._my_email is None:
+            self._my_email = self.get_profile()["emailAddress"].lower()
+        return self._my_email
+
     def reply(
         self,
         message_id: str,
@@ -48,23 +163,8 @@ class ConvenienceMixin:
         Returns:
             Sent message resource.
         """
-        original = self.get_message(message_id, format_="metadata", metadata_headers=["From", "Subject", "Message-ID", "References", "Reply-To"])
-        headers = original.get("payload", {}).get("headers", [])
-
-        to = _get_header(headers, "Reply-To") or _get_header(headers, "From")
-        subject = _get_header(headers, "Subject")
-        if not subject.lower().startswith("re:"):
-            subject = f"Re: {subject}"
-        orig_message_id = _get_header(headers, "Message-ID")
-        references = _get_header(headers, "References")
-
-        raw = build_reply_message(
-            to=to,
-            subject=subject,
-            body=body,
-            message_id=orig_message_id,
-            references=references,
-        )
+        original = self.get_message(message_id, format_="metadata", metadata_headers=_REPLY_HEADERS)
+        raw = _build_reply(original, body)
         return self.send_raw_message(raw=raw, thread_id=original["threadId"])
 
     def forward(
@@ -85,22 +185,8 @@ class ConvenienceMixin:
         Returns:
             Sent message resource.
         """
-        original = self.get_message(message_id, format_="full")
-        headers = original.get("payload", {}).get("headers", [])
-
-        subject = _get_header(headers, "Subject")
-        if not subject.lower().startswith("fwd:"):
-            subject = f"Fwd: {subject}"
-
-        # Extract body from payload
-        original_body = self._extract_body(original.get("payload", {})) or "(no text body found)"
-
-        raw = build_forward_message(
-            to=to,
-            subject=subject,
-            original_body=original_body,
-            note=note,
-        )
+        original = self.get_message(message_id, format_="full", fields=_FORWARD_FIELDS)
+        raw = _build_forward(original, to, note)
         return self.send_raw_message(raw=raw)
 
     def reply_all(
@@ -123,47 +209,10 @@ class ConvenienceMixin:
         original = self.get_message(
             message_id,
             format_="metadata",
-            metadata_headers=["From", "To", "Cc", "Subject", "Message-ID", "References", "Reply-To"],
+            metadata_headers=_REPLY_ALL_HEADERS,
         )
-        headers = original.get("payload", {}).get("headers", [])
-
-        reply_to = _get_header(headers, "Reply-To") or _get_header(headers, "From")
-        orig_from = _get_header(headers, "From")
-        orig_to = _get_header(headers, "To")
-        orig_cc = _get_header(headers, "Cc")
-        subject = _get_header(headers, "Subject")
-        if not subject.lower().startswith("re:"):
-            subject = f"Re: {subject}"
-        orig_message_id = _get_header(headers, "Message-ID")
-        references = _get_header(headers, "References")
-
         # Get own email to exclude from recipients
-        my_email = self.get_profile()["emailAddress"].lower()
-
-        # Collect all recipients: reply-to/from goes in To, everyone else in Cc
-        # Use _extract_email to handle display names like "Alice <alice@example.com>"
-        seen_emails = set()
-        to_addr = reply_to
-        seen_emails.add(_extract_email(to_addr))
-
-        cc_addrs = []
-        all_headers = [h for h in [orig_from, orig_to, orig_cc] if h]
-        for display_name, email_addr in getaddresses(all_headers):
-            bare = email_addr.lower()
-            if bare and bare not in seen_emails and bare != my_email:
-                # Preserve display name if present
-                full = f"{display_name} <{email_addr}>" if display_name else email_addr
-                cc_addrs.append(full)
-                seen_emails.add(bare)
-
-        raw = build_reply_message(
-            to=to_addr,
-            subject=subject,
-            body=body,
-            message_id=orig_message_id,
-            references=references,
-            cc=", ".join(cc_addrs) if cc_addrs else None,
-        )
+        raw = _build_reply_all(original, body, self._get_my_email())
         return self.send_raw_message(raw=raw, thread_id=original["threadId"])
 
     def mark_as_read(self, message_id: str) -> dict[str, Any]:
@@ -199,28 +248,116 @@ class ConvenienceMixin:
         """
         return self.modify_message(message_id, remove_label_ids=["INBOX"])
 
+    def batch_mark_as_read(self, message_ids: list[str]) -> None:
+        """Mark many messages as read with batchModify instead of one call each.
+
+        Args:
+            message_ids: Message IDs (any number; sent 1000 per request).
+        """
+        self.batch_modify_messages(message_ids, remove_label_ids=["UNREAD"])
+
+    def batch_mark_as_unread(self, message_ids: list[str]) -> None:
+        """Mark many messages as unread with batchModify instead of one call each.
+
+        Args:
+            message_ids: Message IDs (any number; sent 1000 per request).
+        """
+        self.batch_modify_messages(message_ids, add_label_ids=["UNREAD"])
+
+    def batch_archive(self, message_ids: list[str]) -> None:
+        """Archive many messages with batchModify instead of one call each.
+
+        Args:
+            message_ids: Message IDs (any number; sent 1000 per request).
+        """
+        self.batch_modify_messages(message_ids, remove_label_ids=["INBOX"])
+
     @staticmethod
     def _extract_body(payload: dict[str, Any], mime_type: str = "text/plain") -> str | None:
         """Extract body from a Gmail message payload by MIME type.
 
-        Recursively traverses nested multipart structures to find the first
-        part matching the given MIME type. Returns None if no match is found.
+        Walks nested multipart structures depth-first, in document order, to
+        find the first part matching the given MIME type. Returns None if no
+        match is found.
 
         Args:
             payload: Gmail message payload dict.
             mime_type: MIME type to extract (default: "text/plain"). Use
                 "text/html" to get the HTML body.
         """
-        import base64
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            # Only touch the body of parts whose type already matches
+            if part.get("mimeType") == mime_type:
+                data = part.get("body", {}).get("data")
+                if data is not None:
+                    return _decode_b64url(data).decode("utf-8", errors="replace")
+            # Push children reversed so the first child is visited next
+            stack.extend(reversed(part.get("parts", [])))
+
+        return None
 
-        # Simple single-part message
-        if payload.get("mimeType") == mime_type and "data" in payload.get("body", {}):
-            return base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8", errors="replace")
 
-        # Multipart — recurse into parts
-        for part in payload.get("parts", []):
-            result = ConvenienceMixin._extract_body(part, mime_type=mime_type)
-            if result is not None:
-                return result
+class AsyncConvenienceMixin:
+    """Async twin of :class:`ConvenienceMixin` for :class:`AsyncGmailClient`."""
 
-        return None
+    async def _get_my_email(self) -> str:
+        """Async version of :meth:`ConvenienceMixin._get_my_email`."""
+        if self._my_email is None:
+            profile = await self.get_profile()
+            self._my_email = profile["emailAddress"].lower()
+        return self._my_email
+
+    async def reply(self, message_id: str, body: str) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.reply`."""
+        original = await self.get_message(message_id, format_="metadata", metadata_headers=_REPLY_HEADERS)
+        raw = _build_reply(original, body)
+        return await self.send_raw_message(raw=raw, thread_id=original["threadId"])
+
+    async def forward(
+        self,
+        message_id: str,
+        to: str,
+        note: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.forward`."""
+        original = await self.get_message(message_id, format_="full", fields=_FORWARD_FIELDS)
+        raw = _build_forward(original, to, note)
+        return await self.send_raw_message(raw=raw)
+
+    async def reply_all(self, message_id: str, body: str) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.reply_all`.
+
+        On first use the original message and the profile are fetched concurrently.
+        """
+        original, my_email = await asyncio.gather(
+            self.get_message(message_id, format_="metadata", metadata_headers=_REPLY_ALL_HEADERS),
+            self._get_my_email(),
+        )
+        raw = _build_reply_all(original, body, my_email)
+        return await self.send_raw_message(raw=raw, thread_id=original["threadId"])
+
+    async def mark_as_read(self, message_id: str) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.mark_as_read`."""
+        return await self.modify_message(message_id, remove_label_ids=["UNREAD"])
+
+    async def mark_as_unread(self, message_id: str) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.mark_as_unread`."""
+        return await self.modify_message(message_id, add_label_ids=["UNREAD"])
+
+    async def archive(self, message_id: str) -> dict[str, Any]:
+        """Async version of :meth:`ConvenienceMixin.archive`."""
+        return await self.modify_message(message_id, remove_label_ids=["INBOX"])
+
+    async def batch_mark_as_read(self, message_ids: list[str]) -> None:
+        """Async version of :meth:`ConvenienceMixin.batch_mark_as_read`."""
+        await self.batch_modify_messages(message_ids, remove_label_ids=["UNREAD"])
+
+    async def batch_mark_as_unread(self, message_ids: list[str]) -> None:
+        """Async version of :meth:`ConvenienceMixin.batch_mark_as_unread`."""
+        await self.batch_modify_messages(message_ids, add_label_ids=["UNREAD"])
+
+    async def batch_archive(self, message_ids: list[str]) -> None:
+        """Async version of :meth:`ConvenienceMixin.batch_archive`."""
+        await self.batch_modify_messages(message_ids, remove_label_ids=["INBOX"])
@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from ._paging import aiter_pages
 from .mime_utils import build_simple_message
+from .refs import _draft_refs
+
+
+def _draft_list_params(
+    max_results: int,
+    page_token: str | None,
+    query: str | None,
+    include_spam_trash: bool,
+) -> dict[str, Any]:
+    """Build query params shared by the sync and async list_drafts."""
+    optional = (("pageToken", page_token), ("q", query), ("includeSpamTrash", include_spam_trash))
+    return {"maxResults": max_results, **{k: v for k, v in optional if v}}
+
+
+def _draft_payload(raw: str, thread_id: str | None) -> dict[str, Any]:
+    """Build the {"message": {...}} body for draft create/update."""
+    message: dict[str, Any] = {"raw": raw}
+    if thread_id:
+        message["threadId"] = thread_id
+    return {"message": message}
 
 
 class DraftsMixin:
@@ -16,6 +38,7 @@ class DraftsMixin:
         page_token: str | None = None,
         query: str | None = None,
         include_spam_trash: bool = False,
+        as_objects: bool = False,
     ) -> dict[str, Any]:
         """GET /users/me/drafts — List drafts.
 
@@ -24,20 +47,16 @@ class DraftsMixin:
             page_token: Pagination token.
             query: Gmail search query.
             include_spam_trash: Include spam and trash drafts.
+            as_objects: Return "drafts" as DraftRef(id, message_id, thread_id) tuples.
 
         Returns:
             {"drafts": [...], "nextPageToken": "...", "resultSizeEstimate": ...}
 
             Note: The "drafts" key is absent when no results match the query.
         """
-        params: dict[str, Any] = {"maxResults": max_results}
-        if page_token:
-            params["pageToken"] = page_token
-        if query:
-            params["q"] = query
-        if include_spam_trash:
-            params["includeSpamTrash"] = True
-        return self._get("/users/me/drafts", params=params)
+        params = _draft_list_params(max_results, page_token, query, include_spam_trash)
+        page = self._get("/users/me/drafts", params=params)
+        return _draft_refs(page) if as_objects else page
 
     def get_draft(
         self,
@@ -82,10 +101,7 @@ class DraftsMixin:
             Created draft resource.
         """
         raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
-        message: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            message["threadId"] = thread_id
-        return self._post("/users/me/drafts", json={"message": message})
+        return self._post("/users/me/drafts", json=_draft_payload(raw, thread_id))
 
     def create_raw_draft(
         self,
@@ -101,10 +117,7 @@ class DraftsMixin:
         Returns:
             Created draft resource.
         """
-        message: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            message["threadId"] = thread_id
-        return self._post("/users/me/drafts", json={"message": message})
+        return self._post("/users/me/drafts", json=_draft_payload(raw, thread_id))
 
     def update_draft(
         self,
@@ -135,10 +148,7 @@ class DraftsMixin:
             Updated draft resource.
         """
         raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
-        message: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            message["threadId"] = thread_id
-        return self._put(f"/users/me/drafts/{draft_id}", json={"message": message})
+        return self._put(f"/users/me/drafts/{draft_id}", json=_draft_payload(raw, thread_id))
 
     def send_draft(self, draft_id: str) -> dict[str, Any]:
         """POST /users/me/drafts/send — Send an existing draft.
@@ -161,3 +171,106 @@ class DraftsMixin:
             HTTP status code (204 on success).
         """
         return self._delete(f"/users/me/drafts/{draft_id}")
+
+    def batch_delete_drafts(self, draft_ids: list[str]) -> list[dict[str, Any]]:
+        """Permanently delete many drafts through the batch endpoint (50 per HTTP request).
+
+        Args:
+            draft_ids: List of draft IDs.
+
+        Returns:
+            One entry per draft, in order: {} on success, {"error": {...}} on failure.
+        """
+        return self.batch_execute([("DELETE", f"/users/me/drafts/{did}", None) for did in draft_ids])
+
+
+class AsyncDraftsMixin:
+    """Async counterpart of :class:`DraftsMixin`."""
+
+    async def list_drafts(
+        self,
+        max_results: int = 10,
+        page_token: str | None = None,
+        query: str | None = None,
+        include_spam_trash: bool = False,
+        as_objects: bool = False,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.list_drafts`."""
+        params = _draft_list_params(max_results, page_token, query, include_spam_trash)
+        page = await self._get("/users/me/drafts", params=params)
+        return _draft_refs(page) if as_objects else page
+
+    async def iter_drafts(
+        self,
+        query: str | None = None,
+        include_spam_trash: bool = False,
+        page_size: int = 500,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every matching draft across all pages, prefetching the next page.
+
+        Args:
+            query: Gmail search query.
+            include_spam_trash: Include spam and trash drafts.
+            page_size: Results per page (max 500).
+        """
+
+        def _fetch(page_token: str | None):
+            return self.list_drafts(page_size, page_token, query, include_spam_trash)
+
+        async for draft in aiter_pages(_fetch, "drafts"):
+            yield draft
+
+    async def get_draft(
+        self,
+        draft_id: str,
+        format_: str = "full",
+    ) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.get_draft`."""
+        return await self._get(f"/users/me/drafts/{draft_id}", params={"format": format_})
+
+    async def create_draft(
+        self,
+        to: str,
+        subject: str,
+        body: str,
+        from_addr: str | None = None,
+        cc: str | None = None,
+        bcc: str | None = None,
+        thread_id: str | None = None,
+        html_body: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.create_draft`."""
+        raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
+        return await self._post("/users/me/drafts", json=_draft_payload(raw, thread_id))
+
+    async def create_raw_draft(
+        self,
+        raw: str,
+        thread_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.create_raw_draft`."""
+        return await self._post("/users/me/drafts", json=_draft_payload(raw, thread_id))
+
+    async def update_draft(
+        self,
+        draft_id: str,
+        to: str,
+        subject: str,
+        body: str,
+        from_addr: str | None = None,
+        cc: str | None = None,
+        bcc: str | None = None,
+        thread_id: str | None = None,
+        html_body: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.update_draft`."""
+        raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
+        return await self._put(f"/users/me/drafts/{draft_id}", json=_draft_payload(raw, thread_id))
+
+    async def send_draft(self, draft_id: str) -> dict[str, Any]:
+        """Async version of :meth:`DraftsMixin.send_draft`."""
+        return await self._post("/users/me/drafts/send", json={"id": draft_id})
+
+    async def delete_draft(self, draft_id: str) -> int:
+        """Async version of :meth:`DraftsMixin.delete_draft`."""
+        return await self._delete(f"/users/me/drafts/{draft_id}")
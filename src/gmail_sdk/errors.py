@@ -0,0 +1,12 @@
+"""Exceptions raised by the Gmail clients."""
+
+from __future__ import annotations
+
+
+class GmailAPIError(Exception):
+    """Exception wrapping Gmail API HTTP errors."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"Gmail API error {status_code}: {message}")
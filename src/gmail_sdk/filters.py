@@ -56,3 +56,14 @@ class FiltersMixin:
             HTTP status code (204 on success).
         """
         return self._delete(f"/users/me/settings/filters/{filter_id}")
+
+    def batch_delete_filters(self, filter_ids: list[str]) -> list[dict[str, Any]]:
+        """Delete many filters through the batch endpoint (50 per HTTP request).
+
+        Args:
+            filter_ids: List of filter IDs.
+
+        Returns:
+            One entry per filter, in order: {} on success, {"error": {...}} on failure.
+        """
+        return self.batch_execute([("DELETE", f"/users/me/settings/filters/{fid}", None) for fid in filter_ids])
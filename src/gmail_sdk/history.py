@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+from ._paging import aiter_pages
+from .batch import BATCH_LIMIT
+
+
+def _history_params(
+    start_history_id: str,
+    label_id: str | None,
+    max_results: int,
+    page_token: str | None,
+    history_types: list[str] | None,
+) -> dict[str, Any]:
+    """Build query params for the history list endpoint."""
+    optional = (("labelId", label_id), ("pageToken", page_token), ("historyTypes", history_types))
+    return {
+        "startHistoryId": start_history_id,
+        "maxResults": max_results,
+        **{k: v for k, v in optional if v},
+    }
+
 
 class HistoryMixin:
     """Mixin providing mailbox history API methods."""
@@ -34,14 +54,93 @@ class HistoryMixin:
 
             Note: The "history" key is absent when no changes exist since start_history_id.
         """
-        params: dict[str, Any] = {
-            "startHistoryId": start_history_id,
-            "maxResults": max_results,
-        }
-        if label_id:
-            params["labelId"] = label_id
-        if page_token:
-            params["pageToken"] = page_token
-        if history_types:
-            params["historyTypes"] = history_types
+        params = _history_params(start_history_id, label_id, max_results, page_token, history_types)
         return self._get("/users/me/history", params=params)
+
+    def iter_new_messages_since(
+        self,
+        start_history_id: str,
+        format_: str = "metadata",
+        metadata_headers: list[str] | None = None,
+        label_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every message added since start_history_id.
+
+        Walks messageAdded history and fetches the new messages through the
+        batch endpoint, BATCH_LIMIT (50) per HTTP request, instead of one
+        get_message call each. Messages deleted again before they could be
+        fetched are skipped.
+
+        Args:
+            start_history_id: History ID to start from (e.g. from get_profile()).
+            format_: Message format: full, metadata, minimal, or raw.
+            metadata_headers: Headers to include when format=metadata.
+            label_id: Only consider messages added with this label.
+
+        Yields:
+            Message resources in history order. Other per-message failures
+            are yielded as {"error": {...}}, as in batch_get_messages.
+        """
+        seen: set[str] = set()
+        pending: list[str] = []
+        page_token = None
+        while True:
+            page = self.list_history(
+                start_history_id,
+                label_id=label_id,
+                max_results=500,
+                page_token=page_token,
+                history_types=["messageAdded"],
+            )
+            for record in page.get("history", ()):
+                for added in record.get("messagesAdded", ()):
+                    message_id = added["message"]["id"]
+                    if message_id not in seen:
+                        seen.add(message_id)
+                        pending.append(message_id)
+            page_token = page.get("nextPageToken")
+            while len(pending) >= BATCH_LIMIT or (pending and not page_token):
+                chunk, pending = pending[:BATCH_LIMIT], pending[BATCH_LIMIT:]
+                for message in self.batch_get_messages(chunk, format_=format_, metadata_headers=metadata_headers):
+                    if message.get("error", {}).get("code") != 404:
+                        yield message
+            if not page_token:
+                return
+
+
+class AsyncHistoryMixin:
+    """Async counterpart of :class:`HistoryMixin`."""
+
+    async def list_history(
+        self,
+        start_history_id: str,
+        label_id: str | None = None,
+        max_results: int = 100,
+        page_token: str | None = None,
+        history_types: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`HistoryMixin.list_history`."""
+        params = _history_params(start_history_id, label_id, max_results, page_token, history_types)
+        return await self._get("/users/me/history", params=params)
+
+    async def iter_history(
+        self,
+        start_history_id: str,
+        label_id: str | None = None,
+        history_types: list[str] | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every history record since start_history_id, prefetching the next page.
+
+        Args:
+            start_history_id: History ID to start listing from (e.g. from get_profile()).
+            label_id: Only return history for this label.
+            history_types: Filter by history type(s).
+            page_size: Records per page (max 500).
+        """
+
+        def _fetch(page_token: str | None):
+            return self.list_history(start_history_id, label_id, page_size, page_token, history_types)
+
+        async for record in aiter_pages(_fetch, "history"):
+            yield record
@@ -4,17 +4,51 @@ from __future__ import annotations
 
 from typing import Any
 
+from .refs import _label_refs
+
+
+def _create_label_payload(
+    name: str,
+    label_list_visibility: str,
+    message_list_visibility: str,
+) -> dict[str, Any]:
+    """Build the request body for create_label."""
+    return {
+        "name": name,
+        "labelListVisibility": label_list_visibility,
+        "messageListVisibility": message_list_visibility,
+    }
+
+
+def _update_label_payload(
+    label_id: str,
+    name: str | None,
+    label_list_visibility: str | None,
+    message_list_visibility: str | None,
+) -> dict[str, Any]:
+    """Build the PATCH body for update_label from only the provided fields."""
+    optional = (
+        ("name", name),
+        ("labelListVisibility", label_list_visibility),
+        ("messageListVisibility", message_list_visibility),
+    )
+    return {"id": label_id, **{k: v for k, v in optional if v is not None}}
+
 
 class LabelsMixin:
     """Mixin providing label API methods."""
 
-    def list_labels(self) -> dict[str, Any]:
+    def list_labels(self, as_objects: bool = False) -> dict[str, Any]:
         """GET /users/me/labels — List all labels.
 
+        Args:
+            as_objects: Return "labels" as LabelRef(id, name, type) tuples.
+
         Returns:
             {"labels": [{"id": "...", "name": "...", "type": "..."}]}
         """
-        return self._get("/users/me/labels")
+        page = self._get("/users/me/labels")
+        return _label_refs(page) if as_objects else page
 
     def get_label(self, label_id: str) -> dict[str, Any]:
         """GET /users/me/labels/{id} — Get a specific label.
@@ -43,14 +77,8 @@ class LabelsMixin:
         Returns:
             Created label resource.
         """
-        return self._post(
-            "/users/me/labels",
-            json={
-                "name": name,
-                "labelListVisibility": label_list_visibility,
-                "messageListVisibility": message_list_visibility,
-            },
-        )
+        payload = _create_label_payload(name, label_list_visibility, message_list_visibility)
+        return self._post("/users/me/labels", json=payload)
 
     def update_label(
         self,
@@ -73,13 +101,7 @@ class LabelsMixin:
         Returns:
             Updated label resource.
         """
-        payload: dict[str, Any] = {"id": label_id}
-        if name is not None:
-            payload["name"] = name
-        if label_list_visibility is not None:
-            payload["labelListVisibility"] = label_list_visibility
-        if message_list_visibility is not None:
-            payload["messageListVisibility"] = message_list_visibility
+        payload = _update_label_payload(label_id, name, label_list_visibility, message_list_visibility)
         return self._patch(f"/users/me/labels/{label_id}", json=payload)
 
     def delete_label(self, label_id: str) -> int:
@@ -92,3 +114,52 @@ class LabelsMixin:
             HTTP status code (204 on success).
         """
         return self._delete(f"/users/me/labels/{label_id}")
+
+    def batch_delete_labels(self, label_ids: list[str]) -> list[dict[str, Any]]:
+        """Delete many labels through the batch endpoint (50 per HTTP request).
+
+        Args:
+            label_ids: List of label IDs.
+
+        Returns:
+            One entry per label, in order: {} on success, {"error": {...}} on failure.
+        """
+        return self.batch_execute([("DELETE", f"/users/me/labels/{lid}", None) for lid in label_ids])
+
+
+class AsyncLabelsMixin:
+    """Async counterpart of :class:`LabelsMixin`."""
+
+    async def list_labels(self, as_objects: bool = False) -> dict[str, Any]:
+        """Async version of :meth:`LabelsMixin.list_labels`."""
+        page = await self._get("/users/me/labels")
+        return _label_refs(page) if as_objects else page
+
+    async def get_label(self, label_id: str) -> dict[str, Any]:
+        """Async version of :meth:`LabelsMixin.get_label`."""
+        return await self._get(f"/users/me/labels/{label_id}")
+
+    async def create_label(
+        self,
+        name: str,
+        label_list_visibility: str = "labelShow",
+        message_list_visibility: str = "show",
+    ) -> dict[str, Any]:
+        """Async version of :meth:`LabelsMixin.create_label`."""
+        payload = _create_label_payload(name, label_list_visibility, message_list_visibility)
+        return await self._post("/users/me/labels", json=payload)
+
+    async def update_label(
+        self,
+        label_id: str,
+        name: str | None = None,
+        label_list_visibility: str | None = None,
+        message_list_visibility: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`LabelsMixin.update_label`."""
+        payload = _update_label_payload(label_id, name, label_list_visibility, message_list_visibility)
+        return await self._patch(f"/users/me/labels/{label_id}", json=payload)
+
+    async def delete_label(self, label_id: str) -> int:
+        """Async version of :meth:`LabelsMixin.delete_label`."""
+        return await self._delete(f"/users/me/labels/{label_id}")
@@ -2,9 +2,120 @@
 
 from __future__ import annotations
 
+import asyncio
+import binascii
+import re
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
+from urllib.parse import urlencode
 
+from ._paging import aiter_pages
 from .mime_utils import build_simple_message
+from .refs import _message_refs
+
+# Maximum number of IDs accepted by messages.batchModify/batchDelete in one request.
+BATCH_MODIFY_LIMIT = 1000
+# Chunk size used when streaming format=raw message bodies.
+RAW_CHUNK_SIZE = 64 * 1024
+
+_RAW_VALUE_START = re.compile(rb'"raw"\s*:\s*"')
+_B64URL_DECODE = bytes.maketrans(b"-_", b"+/")
+
+
+def _chunks(items: list[str], size: int) -> Iterator[list[str]]:
+    """Yield successive slices of at most size items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class _RawFieldDecoder:
+    """Incrementally base64url-decode the "raw" string of a streamed message body.
+
+    The value is a single unescaped base64url string, so it is enough to find
+    its opening quote and decode complete 4-character groups as they arrive.
+    """
+
+    def __init__(self) -> None:
+        self._head = b""
+        self._pending = b""
+        self._in_value = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Consume a chunk of the JSON body and return any newly decoded bytes."""
+        if self.done:
+            return b""
+        if not self._in_value:
+            self._head += chunk
+            match = _RAW_VALUE_START.search(self._head)
+            if match is None:
+                return b""
+            chunk = self._head[match.end():]
+            self._head = b""
+            self._in_value = True
+        end = chunk.find(b'"')
+        if end != -1:
+            chunk = chunk[:end]
+            self.done = True
+        data = self._pending + chunk
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        return binascii.a2b_base64(data[:usable].translate(_B64URL_DECODE)) if usable else b""
+
+    def flush(self) -> bytes:
+        """Decode whatever is left once the body has been fully read."""
+        if not self._in_value:
+            raise ValueError("Response did not contain a raw message")
+        tail, self._pending = self._pending, b""
+        if not tail:
+            return b""
+        return binascii.a2b_base64(tail.translate(_B64URL_DECODE) + b"=" * (-len(tail) % 4))
+
+
+def _list_params(
+    query: str | None,
+    max_results: int,
+    label_ids: list[str] | None,
+    page_token: str | None,
+    include_spam_trash: bool,
+) -> dict[str, Any]:
+    """Build query params for the message and thread list endpoints."""
+    optional = (
+        ("q", query),
+        ("labelIds", label_ids),
+        ("pageToken", page_token),
+        ("includeSpamTrash", include_spam_trash),
+    )
+    return {"maxResults": max_results, **{k: v for k, v in optional if v}}
+
+
+def _format_params(
+    format_: str,
+    metadata_headers: list[str] | None,
+    fields: str | None = None,
+) -> dict[str, Any]:
+    """Build query params for message and thread GETs."""
+    if not metadata_headers and not fields:
+        return {"format": format_}
+    optional = (("metadataHeaders", metadata_headers), ("fields", fields))
+    return {"format": format_, **{k: v for k, v in optional if v}}
+
+
+def _label_payload(
+    add_label_ids: list[str] | None,
+    remove_label_ids: list[str] | None,
+) -> dict[str, Any]:
+    """Build the body for a label modify request."""
+    pairs = (("addLabelIds", add_label_ids), ("removeLabelIds", remove_label_ids))
+    return {k: v for k, v in pairs if v is not None}
+
+
+def _send_payload(raw: str, thread_id: str | None) -> dict[str, Any]:
+    """Build the body for a send request."""
+    payload: dict[str, Any] = {"raw": raw}
+    if thread_id:
+        payload["threadId"] = thread_id
+    return payload
 
 
 class MessagesMixin:
@@ -25,6 +136,7 @@ class MessagesMixin:
         label_ids: list[str] | None = None,
         page_token: str | None = None,
         include_spam_trash: bool = False,
+        as_objects: bool = False,
     ) -> dict[str, Any]:
         """GET /users/me/messages — List messages.
 
@@ -34,28 +146,23 @@ class MessagesMixin:
             label_ids: Filter by label IDs.
             page_token: Pagination token.
             include_spam_trash: Include spam and trash messages.
+            as_objects: Return "messages" as MessageRef(id, thread_id) tuples.
 
         Returns:
             {"messages": [{"id": "...", "threadId": "..."}], "nextPageToken": "...", "resultSizeEstimate": ...}
 
             Note: The "messages" key is absent when no results match the query.
         """
-        params: dict[str, Any] = {"maxResults": max_results}
-        if query:
-            params["q"] = query
-        if label_ids:
-            params["labelIds"] = label_ids
-        if page_token:
-            params["pageToken"] = page_token
-        if include_spam_trash:
-            params["includeSpamTrash"] = True
-        return self._get("/users/me/messages", params=params)
+        params = _list_params(query, max_results, label_ids, page_token, include_spam_trash)
+        page = self._get("/users/me/messages", params=params)
+        return _message_refs(page) if as_objects else page
 
     def get_message(
         self,
         message_id: str,
         format_: str = "full",
         metadata_headers: list[str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """GET /users/me/messages/{id} — Get a specific message.
 
@@ -63,15 +170,51 @@ class MessagesMixin:
             message_id: The message ID.
             format_: Response format: full, metadata, minimal, or raw.
             metadata_headers: Headers to include when format=metadata.
+            fields: Partial-response selector (e.g. "id,payload/headers") to
+                trim the response to the fields you need.
 
         Returns:
             Full message resource.
         """
-        params: dict[str, Any] = {"format": format_}
-        if metadata_headers:
-            params["metadataHeaders"] = metadata_headers
+        params = _format_params(format_, metadata_headers, fields)
         return self._get(f"/users/me/messages/{message_id}", params=params)
 
+    def iter_message_raw(self, message_id: str) -> Iterator[bytes]:
+        """Stream a message's RFC 822 bytes without buffering the whole response.
+
+        Fetches format=raw and decodes the base64url payload chunk by chunk,
+        so peak memory stays around RAW_CHUNK_SIZE regardless of message size.
+
+        Args:
+            message_id: The message ID.
+
+        Yields:
+            Successive pieces of the decoded message.
+        """
+        decoder = _RawFieldDecoder()
+        params = {"format": "raw", "fields": "raw"}
+        with self._stream("GET", f"/users/me/messages/{message_id}", params=params) as resp:
+            for chunk in resp.iter_bytes(RAW_CHUNK_SIZE):
+                data = decoder.feed(chunk)
+                if data:
+                    yield data
+                if decoder.done:
+                    break
+        tail = decoder.flush()
+        if tail:
+            yield tail
+
+    def get_message_raw_bytes(self, message_id: str) -> bytes:
+        """Return a message's decoded RFC 822 bytes, skipping the JSON parse.
+
+        Args:
+            message_id: The message ID.
+
+        Returns:
+            The raw message, ready for email.message_from_bytes().
+        """
+        return b"".join(self.iter_message_raw(message_id))
+
     def send_message(
         self,
         to: str,
@@ -99,10 +242,7 @@ class MessagesMixin:
             Sent message resource.
         """
         raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
-        payload: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            payload["threadId"] = thread_id
-        return self._post("/users/me/messages/send", json=payload)
+        return self._post("/users/me/messages/send", json=_send_payload(raw, thread_id))
 
     def send_raw_message(
         self,
@@ -118,10 +258,7 @@ class MessagesMixin:
         Returns:
             Sent message resource.
         """
-        payload: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            payload["threadId"] = thread_id
-        return self._post("/users/me/messages/send", json=payload)
+        return self._post("/users/me/messages/send", json=_send_payload(raw, thread_id))
 
     def modify_message(
         self,
@@ -139,11 +276,7 @@ class MessagesMixin:
         Returns:
             Modified message resource.
         """
-        payload: dict[str, Any] = {}
-        if add_label_ids is not None:
-            payload["addLabelIds"] = add_label_ids
-        if remove_label_ids is not None:
-            payload["removeLabelIds"] = remove_label_ids
+        payload = _label_payload(add_label_ids, remove_label_ids)
         return self._post(f"/users/me/messages/{message_id}/modify", json=payload)
 
     def trash_message(self, message_id: str) -> dict[str, Any]:
@@ -187,17 +320,51 @@ class MessagesMixin:
     ) -> None:
         """POST /users/me/messages/batchModify — Modify labels on multiple messages.
 
+        Lists longer than the API's 1000-ID limit are sent in several requests.
+
         Args:
             message_ids: List of message IDs.
             add_label_ids: Labels to add.
             remove_label_ids: Labels to remove.
         """
-        payload: dict[str, Any] = {"ids": message_ids}
-        if add_label_ids is not None:
-            payload["addLabelIds"] = add_label_ids
-        if remove_label_ids is not None:
-            payload["removeLabelIds"] = remove_label_ids
-        self._post("/users/me/messages/batchModify", json=payload)
+        labels = _label_payload(add_label_ids, remove_label_ids)
+        for chunk in _chunks(message_ids, BATCH_MODIFY_LIMIT):
+            self._post("/users/me/messages/batchModify", json={"ids": chunk, **labels})
+
+    def batch_get_messages(
+        self,
+        message_ids: list[str],
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get many messages through the batch endpoint (50 per HTTP request).
+
+        Args:
+            message_ids: List of message IDs.
+            format_: Response format: full, metadata, minimal, or raw.
+            metadata_headers: Headers to include when format=metadata.
+
+        Returns:
+            Message resources in the order of message_ids. A message that
+            could not be fetched is returned as {"error": {...}}.
+        """
+        query = urlencode(_format_params(format_, metadata_headers), doseq=True)
+        return self.batch_execute(
+            [("GET", f"/users/me/messages/{mid}?{query}", None) for mid in message_ids]
+        )
+
+    def batch_trash_messages(self, message_ids: list[str]) -> list[dict[str, Any]]:
+        """Move many messages to trash through the batch endpoint.
+
+        Args:
+            message_ids: List of message IDs.
+
+        Returns:
+            Trashed message resources (or {"error": {...}}) in input order.
+        """
+        return self.batch_execute(
+            [("POST", f"/users/me/messages/{mid}/trash", None) for mid in message_ids]
+        )
 
     def batch_delete_messages(self, message_ids: list[str]) -> None:
         """POST /users/me/messages/batchDelete — Permanently delete multiple messages.
@@ -205,7 +372,173 @@ class MessagesMixin:
         **WARNING: This permanently and irreversibly deletes messages.
         They cannot be recovered from trash.**
 
+        Sends one request per 1000 IDs.
+
         Args:
             message_ids: List of message IDs to delete.
         """
-        self._post("/users/me/messages/batchDelete", json={"ids": message_ids})
+        for chunk in _chunks(message_ids, BATCH_MODIFY_LIMIT):
+            self._post("/users/me/messages/batchDelete", json={"ids": chunk})
+
+
+class AsyncMessagesMixin:
+    """Async twin of :class:`MessagesMixin` for :class:`AsyncGmailClient`."""
+
+    async def get_profile(self) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.get_profile`."""
+        return await self._get("/users/me/profile")
+
+    async def list_messages(
+        self,
+        query: str | None = None,
+        max_results: int = 10,
+        label_ids: list[str] | None = None,
+        page_token: str | None = None,
+        include_spam_trash: bool = False,
+        as_objects: bool = False,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.list_messages`."""
+        params = _list_params(query, max_results, label_ids, page_token, include_spam_trash)
+        page = await self._get("/users/me/messages", params=params)
+        return _message_refs(page) if as_objects else page
+
+    async def iter_messages(
+        self,
+        query: str | None = None,
+        label_ids: list[str] | None = None,
+        include_spam_trash: bool = False,
+        page_size: int = 500,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every matching message stub ({"id", "threadId"}) across all pages.
+
+        The next page is requested while the current one is being consumed.
+
+        Args:
+            query: Gmail search query.
+            label_ids: Only return messages with all of these label IDs.
+            include_spam_trash: Include messages from SPAM and TRASH.
+            page_size: Results per page (max 500).
+        """
+
+        def _fetch(page_token: str | None):
+            return self.list_messages(query, page_size, label_ids, page_token, include_spam_trash)
+
+        async for message in aiter_pages(_fetch, "messages"):
+            yield message
+
+    async def get_message(
+        self,
+        message_id: str,
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+        fields: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.get_message`."""
+        params = _format_params(format_, metadata_headers, fields)
+        return await self._get(f"/users/me/messages/{message_id}", params=params)
+
+    async def gather_get_messages(
+        self,
+        message_ids: list[str],
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+        concurrency: int = 64,
+    ) -> list[dict[str, Any]]:
+        """Fetch many messages concurrently, at most ``concurrency`` in flight.
+
+        Args:
+            message_ids: List of message IDs.
+            format_: Response format: full, metadata, minimal, or raw.
+            metadata_headers: Headers to include when format=metadata.
+            concurrency: Maximum number of simultaneous requests.
+
+        Returns:
+            Message resources in the order of message_ids.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _fetch(message_id: str) -> dict[str, Any]:
+            async with sem:
+                return await self.get_message(message_id, format_=format_, metadata_headers=metadata_headers)
+
+        return list(await asyncio.gather(*(_fetch(mid) for mid in message_ids)))
+
+    async def iter_message_raw(self, message_id: str) -> AsyncIterator[bytes]:
+        """Async version of :meth:`MessagesMixin.iter_message_raw`."""
+        decoder = _RawFieldDecoder()
+        params = {"format": "raw", "fields": "raw"}
+        async with self._stream("GET", f"/users/me/messages/{message_id}", params=params) as resp:
+            async for chunk in resp.aiter_bytes(RAW_CHUNK_SIZE):
+                data = decoder.feed(chunk)
+                if data:
+                    yield data
+                if decoder.done:
+                    break
+        tail = decoder.flush()
+        if tail:
+            yield tail
+
+    async def get_message_raw_bytes(self, message_id: str) -> bytes:
+        """Async version of :meth:`MessagesMixin.get_message_raw_bytes`."""
+        return b"".join([piece async for piece in self.iter_message_raw(message_id)])
+
+    async def send_message(
+        self,
+        to: str,
+        subject: str,
+        body: str,
+        from_addr: str | None = None,
+        cc: str | None = None,
+        bcc: str | None = None,
+        thread_id: str | None = None,
+        html_body: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.send_message`."""
+        raw = build_simple_message(to=to, subject=subject, body=body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body)
+        return await self._post("/users/me/messages/send", json=_send_payload(raw, thread_id))
+
+    async def send_raw_message(
+        self,
+        raw: str,
+        thread_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.send_raw_message`."""
+        return await self._post("/users/me/messages/send", json=_send_payload(raw, thread_id))
+
+    async def modify_message(
+        self,
+        message_id: str,
+        add_label_ids: list[str] | None = None,
+        remove_label_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.modify_message`."""
+        payload = _label_payload(add_label_ids, remove_label_ids)
+        return await self._post(f"/users/me/messages/{message_id}/modify", json=payload)
+
+    async def trash_message(self, message_id: str) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.trash_message`."""
+        return await self._post(f"/users/me/messages/{message_id}/trash")
+
+    async def untrash_message(self, message_id: str) -> dict[str, Any]:
+        """Async version of :meth:`MessagesMixin.untrash_message`."""
+        return await self._post(f"/users/me/messages/{message_id}/untrash")
+
+    async def delete_message(self, message_id: str) -> int:
+        """Async version of :meth:`MessagesMixin.delete_message`."""
+        return await self._delete(f"/users/me/messages/{message_id}")
+
+    async def batch_modify_messages(
+        self,
+        message_ids: list[str],
+        add_label_ids: list[str] | None = None,
+        remove_label_ids: list[str] | None = None,
+    ) -> None:
+        """Async version of :meth:`MessagesMixin.batch_modify_messages`."""
+        labels = _label_payload(add_label_ids, remove_label_ids)
+        for chunk in _chunks(message_ids, BATCH_MODIFY_LIMIT):
+            await self._post("/users/me/messages/batchModify", json={"ids": chunk, **labels})
+
+    async def batch_delete_messages(self, message_ids: list[str]) -> None:
+        """Async version of :meth:`MessagesMixin.batch_delete_messages`."""
+        for chunk in _chunks(message_ids, BATCH_MODIFY_LIMIT):
+            await self._post("/users/me/messages/batchDelete", json={"ids": chunk})
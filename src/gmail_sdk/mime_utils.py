@@ -3,14 +3,179 @@
 from __future__ import annotations
 
 import base64
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import binascii
+import secrets
+from email.header import Header
+from email.utils import formataddr, getaddresses
+from typing import TYPE_CHECKING
 
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - exercised when pybase64 is absent
+    pybase64 = None
 
-def encode_message(mime_msg: MIMEText | MIMEMultipart) -> str:
-    """Base64url-encode a MIME message for the Gmail API."""
-    raw = mime_msg.as_bytes()
-    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+if TYPE_CHECKING:
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+__all__ = [
+    "build_simple_message",
+    "build_reply_message",
+    "build_forward_message",
+    "encode_message",
+]
+
+_ADDRESS_HEADERS = frozenset({"From", "To", "Cc", "Bcc"})
+# RFC 5322 hard limit on line length, excluding CRLF.
+_MAX_LINE = 998
+# Recommended header line length (RFC 5322 2.1.1); longer ASCII headers are folded.
+_FOLD_AT = 78
+_B64URL_TRANS = bytes.maketrans(b"+/", b"-_")
+_FWD_SEP = "\n---------- Forwarded message ----------\n"
+
+
+def _unpadded(encoded: bytes, raw_len: int) -> str:
+    """Drop the base64 padding of encoded (raw_len input bytes) and return it as str.
+
+    The pad length follows from raw_len, and decoding a memoryview slice
+    avoids copying the encoded buffer once more before the str is built.
+    """
+    return str(memoryview(encoded)[: len(encoded) - (-raw_len % 3)], "ascii")
+
+
+if pybase64 is not None:
+
+    def _encode_raw(raw: bytes | bytearray) -> str:
+        """Base64url-encode raw RFC 5322 bytes, without padding (SIMD via pybase64)."""
+        return _unpadded(pybase64.urlsafe_b64encode(raw), len(raw))
+
+    # MIME body encoding (76-char lines) and base64url decoding of Gmail body data
+    _encode_lines = pybase64.encodebytes
+    _b64url_decode = pybase64.urlsafe_b64decode
+
+else:
+
+    def _encode_raw(raw: bytes | bytearray) -> str:
+        """Base64url-encode raw RFC 5322 bytes, without padding."""
+        return _unpadded(binascii.b2a_base64(raw, newline=False).translate(_B64URL_TRANS), len(raw))
+
+    _encode_lines = base64.encodebytes
+    _b64url_decode = base64.urlsafe_b64decode
+
+
+def _decode_b64url(data: str | bytes) -> bytes:
+    """Decode base64url data, which Gmail may send without padding."""
+    return _b64url_decode(data + ("=" if isinstance(data, str) else b"=") * (-len(data) % 4))
+
+
+def encode_message(mime_msg: MIMEText | MIMEMultipart | bytes | bytearray) -> str:
+    """Base64url-encode a MIME message (or its raw bytes) for the Gmail API."""
+    if isinstance(mime_msg, (bytes, bytearray)):
+        return _encode_raw(mime_msg)
+    return _encode_raw(mime_msg.as_bytes())
+
+
+def _fold(name: str, value: str) -> str:
+    """Fold an ASCII header at spaces so its lines stay near _FOLD_AT characters.
+
+    A word longer than that stays whole on its own line; only a line past
+    the RFC 5322 limit of _MAX_LINE characters is rejected.
+    """
+    words = value.split(" ")
+    lines = []
+    line = f"{name}: {words[0]}"
+    for word in words[1:]:
+        if word and len(line) + 1 + len(word) > _FOLD_AT:
+            lines.append(line)
+            line = f" {word}"
+        else:
+            line += f" {word}"
+    lines.append(line)
+    if max(map(len, lines)) > _MAX_LINE:
+        raise ValueError(f"{name} header has a word longer than {_MAX_LINE} characters")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _header(name: str, value: str) -> str:
+    """Render one header line, RFC 2047-encoding it only when it is not ASCII."""
+    if "\r" in value or "\n" in value:
+        raise ValueError(f"{name} header must not contain CR or LF")
+    if value.isascii():
+        if len(name) + 2 + len(value) <= _FOLD_AT:
+            return f"{name}: {value}\r\n"
+        return _fold(name, value)
+    if name in _ADDRESS_HEADERS:
+        try:
+            value = ", ".join(formataddr(pair, charset="utf-8") for pair in getaddresses([value]))
+        except UnicodeEncodeError:
+            pass  # Non-ASCII mailbox: send it as raw UTF-8 (RFC 6532), which Gmail accepts.
+        return f"{name}: {value}\r\n"
+    encoded = Header(value, "utf-8", header_name=name).encode(linesep="\r\n")
+    return f"{name}: {encoded}\r\n"
+
+
+def _text_part(subtype: str, text: str) -> bytes:
+    """Render Content-Type/Content-Transfer-Encoding headers plus the encoded body."""
+    seven_bit = False
+    if text.isascii():
+        # CRLF and bare CR become LF, so the 7bit payload only ever has CRLF line breaks.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        seven_bit = len(text) <= _MAX_LINE or max(map(len, text.split("\n"))) <= _MAX_LINE
+    if seven_bit:
+        encoding = "7bit"
+        payload = text.replace("\n", "\r\n").encode("ascii")
+    else:
+        encoding = "base64"
+        payload = _encode_lines(text.encode("utf-8")).replace(b"\n", b"\r\n")
+    return (
+        f'Content-Type: text/{subtype}; charset="utf-8"\r\n'
+        f"Content-Transfer-Encoding: {encoding}\r\n\r\n"
+    ).encode("ascii") + payload
+
+
+def _build_raw(
+    to: str,
+    subject: str,
+    body: str,
+    from_addr: str | None = None,
+    cc: str | None = None,
+    bcc: str | None = None,
+    in_reply_to: str | None = None,
+    references: str | None = None,
+    html_body: str | None = None,
+) -> bytes:
+    """Assemble an RFC 5322 message directly as bytes.
+
+    Builds the handful of headers Gmail needs without going through
+    email.message/email.generator; header values are only run through
+    RFC 2047 encoding when they contain non-ASCII text.
+    """
+    headers = ["MIME-Version: 1.0\r\n", _header("To", to), _header("Subject", subject)]
+    if from_addr:
+        headers.append(_header("From", from_addr))
+    if cc:
+        headers.append(_header("Cc", cc))
+    if bcc:
+        headers.append(_header("Bcc", bcc))
+    if in_reply_to:
+        headers.append(_header("In-Reply-To", in_reply_to))
+    if references:
+        headers.append(_header("References", references))
+
+    if not html_body:
+        return "".join(headers).encode("utf-8") + _text_part("plain", body)
+
+    boundary = secrets.token_hex(16)
+    headers.append(f'Content-Type: multipart/alternative; boundary="{boundary}"\r\n\r\n')
+    delimiter = f"\r\n--{boundary}\r\n".encode("ascii")
+    return b"".join([
+        "".join(headers).encode("utf-8"),
+        f"--{boundary}\r\n".encode("ascii"),
+        _text_part("plain", body),
+        delimiter,
+        _text_part("html", html_body),
+        f"\r\n--{boundary}--\r\n".encode("ascii"),
+    ])
 
 
 def build_simple_message(
@@ -37,21 +202,7 @@ def build_simple_message(
     Returns:
         Base64url-encoded MIME message string.
     """
-    if html_body:
-        msg = MIMEMultipart("alternative")
-        msg.attach(MIMEText(body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-    else:
-        msg = MIMEText(body)
-    msg["To"] = to
-    msg["Subject"] = subject
-    if from_addr:
-        msg["From"] = from_addr
-    if cc:
-        msg["Cc"] = cc
-    if bcc:
-        msg["Bcc"] = bcc
-    return encode_message(msg)
+    return _encode_raw(_build_raw(to, subject, body, from_addr=from_addr, cc=cc, bcc=bcc, html_body=html_body))
 
 
 def build_reply_message(
@@ -79,21 +230,16 @@ def build_reply_message(
     Returns:
         Base64url-encoded MIME message string.
     """
-    if html_body:
-        msg = MIMEMultipart("alternative")
-        msg.attach(MIMEText(body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-    else:
-        msg = MIMEText(body)
-    msg["To"] = to
-    msg["Subject"] = subject
-    msg["In-Reply-To"] = message_id
-    msg["References"] = references or message_id
-    if from_addr:
-        msg["From"] = from_addr
-    if cc:
-        msg["Cc"] = cc
-    return encode_message(msg)
+    return _encode_raw(_build_raw(
+        to,
+        subject,
+        body,
+        from_addr=from_addr,
+        cc=cc,
+        in_reply_to=message_id,
+        references=references or message_id,
+        html_body=html_body,
+    ))
 
 
 def build_forward_message(
@@ -118,20 +264,5 @@ def build_forward_message(
     Returns:
         Base64url-encoded MIME message string.
     """
-    parts = []
-    if note:
-        parts.append(note)
-    parts.append(f"\n---------- Forwarded message ----------\n{original_body}")
-    full_body = "\n".join(parts)
-
-    if html_body:
-        msg = MIMEMultipart("alternative")
-        msg.attach(MIMEText(full_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-    else:
-        msg = MIMEText(full_body)
-    msg["To"] = to
-    msg["Subject"] = subject
-    if from_addr:
-        msg["From"] = from_addr
-    return encode_message(msg)
+    full_body = f"{note}\n{_FWD_SEP}{original_body}" if note else f"{_FWD_SEP}{original_body}"
+    return _encode_raw(_build_raw(to, subject, full_body, from_addr=from_addr, html_body=html_body))
@@ -0,0 +1,55 @@
+"""Compact typed views of list results.
+
+Passing ``as_objects=True`` to a list method swaps the page's item dicts for
+these tuples, which are smaller than dicts and expose fields as attributes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class MessageRef(NamedTuple):
+    """A message stub returned by list_messages."""
+
+    id: str
+    thread_id: str
+
+
+class DraftRef(NamedTuple):
+    """A draft stub returned by list_drafts."""
+
+    id: str
+    message_id: str
+    thread_id: str
+
+
+class LabelRef(NamedTuple):
+    """A label summary returned by list_labels."""
+
+    id: str
+    name: str
+    type: str
+
+
+def _message_refs(page: dict[str, Any]) -> dict[str, Any]:
+    """Replace a list_messages page's "messages" with MessageRef tuples."""
+    if "messages" in page:
+        page["messages"] = [MessageRef(m["id"], m["threadId"]) for m in page["messages"]]
+    return page
+
+
+def _draft_refs(page: dict[str, Any]) -> dict[str, Any]:
+    """Replace a list_drafts page's "drafts" with DraftRef tuples."""
+    if "drafts" in page:
+        page["drafts"] = [
+            DraftRef(d["id"], d["message"]["id"], d["message"].get("threadId", "")) for d in page["drafts"]
+        ]
+    return page
+
+
+def _label_refs(page: dict[str, Any]) -> dict[str, Any]:
+    """Replace a list_labels page's "labels" with LabelRef tuples."""
+    if "labels" in page:
+        page["labels"] = [LabelRef(lb["id"], lb["name"], lb.get("type", "user")) for lb in page["labels"]]
+    return page
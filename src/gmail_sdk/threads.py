@@ -2,7 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
+from urllib.parse import urlencode
+
+from . import _json
+from .errors import GmailAPIError
+from .messages import _format_params, _label_payload, _list_params
+
+# Maximum number of threads kept by get_thread(use_cache=True).
+THREAD_CACHE_SIZE = 512
+
+# First backoff delay in seconds when gather_delete_threads is rate limited (429).
+RATE_LIMIT_BACKOFF = 1.0
+
+ThreadCache = OrderedDict[tuple, bytes]
+
+
+def _thread_cache_key(thread_id: str, format_: str, metadata_headers: list[str] | None) -> tuple:
+    """Key a cached thread by ID and the response shape requested."""
+    return (thread_id, format_, tuple(metadata_headers or ()))
+
+
+def _thread_cache_get(cache: ThreadCache, key: tuple) -> dict[str, Any] | None:
+    """Return a fresh copy of a cached thread, marking it most recently used."""
+    body = cache.get(key)
+    if body is None:
+        return None
+    cache.move_to_end(key)
+    return _json.loads(body)
+
+
+def _thread_cache_put(cache: ThreadCache, key: tuple, thread: dict[str, Any]) -> None:
+    """Store a thread, evicting the least recently used one past THREAD_CACHE_SIZE.
+
+    Threads are kept serialized, as ETagCache does, so callers can mutate
+    the dicts they get back without corrupting later hits.
+    """
+    cache[key] = _json.dumps(thread)
+    if len(cache) > THREAD_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _thread_cache_invalidate(cache: ThreadCache, thread_id: str) -> None:
+    """Drop every cached format of thread_id."""
+    for key in [k for k in cache if k[0] == thread_id]:
+        del cache[key]
 
 
 class ThreadsMixin:
@@ -30,15 +77,7 @@ class ThreadsMixin:
 
             Note: The "threads" key is absent when no results match the query.
         """
-        params: dict[str, Any] = {"maxResults": max_results}
-        if query:
-            params["q"] = query
-        if label_ids:
-            params["labelIds"] = label_ids
-        if page_token:
-            params["pageToken"] = page_token
-        if include_spam_trash:
-            params["includeSpamTrash"] = True
+        params = _list_params(query, max_results, label_ids, page_token, include_spam_trash)
         return self._get("/users/me/threads", params=params)
 
     def get_thread(
@@ -46,6 +85,7 @@ class ThreadsMixin:
         thread_id: str,
         format_: str = "full",
         metadata_headers: list[str] | None = None,
+        use_cache: bool = False,
     ) -> dict[str, Any]:
         """GET /users/me/threads/{id} — Get a specific thread.
 
@@ -53,14 +93,73 @@ class ThreadsMixin:
             thread_id: The thread ID.
             format_: Response format: full, metadata, or minimal.
             metadata_headers: Headers to include when format=metadata.
+            use_cache: Serve repeat lookups from an in-memory LRU of the last
+                THREAD_CACHE_SIZE threads. Entries are dropped by this
+                client's modify/trash/untrash/delete_thread, but changes
+                made any other way (other clients, modify_message) are not
+                seen, so only use this where slightly stale data is fine.
 
         Returns:
             Full thread resource with messages.
         """
-        params: dict[str, Any] = {"format": format_}
-        if metadata_headers:
-            params["metadataHeaders"] = metadata_headers
-        return self._get(f"/users/me/threads/{thread_id}", params=params)
+        params = _format_params(format_, metadata_headers)
+        if not use_cache:
+            return self._get(f"/users/me/threads/{thread_id}", params=params)
+        key = _thread_cache_key(thread_id, format_, metadata_headers)
+        if (thread := _thread_cache_get(self._thread_cache, key)) is not None:
+            return thread
+        thread = self._get(f"/users/me/threads/{thread_id}", params=params)
+        _thread_cache_put(self._thread_cache, key, thread)
+        return thread
+
+    def iter_thread_items(
+        self,
+        thread_id: str,
+        prefix: str = "messages.item",
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+    ) -> Iterator[Any]:
+        """Stream-parse a thread, yielding only the values under prefix.
+
+        A full thread can be megabytes of JSON; this parses the response as
+        it arrives with ijson (the ``stream`` extra) so only one item is
+        materialized at a time. Bypasses the ETag and thread caches.
+
+        Args:
+            thread_id: The thread ID.
+            prefix: ijson path to yield, e.g. "messages.item" for each
+                message or "messages.item.payload.headers" for each
+                message's header list.
+            format_: Response format: full, metadata, or minimal.
+            metadata_headers: Headers to include when format=metadata.
+
+        Yields:
+            Each value found at prefix, in document order.
+        """
+        params = _format_params(format_, metadata_headers)
+        with self._stream("GET", f"/users/me/threads/{thread_id}", params=params) as resp:
+            yield from _json.iter_items(resp.iter_bytes(), prefix)
+
+    def batch_get_threads(
+        self,
+        thread_ids: list[str],
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get many threads through the batch endpoint (50 per HTTP request).
+
+        Args:
+            thread_ids: List of thread IDs.
+            format_: Response format: full, metadata, or minimal.
+            metadata_headers: Headers to include when format=metadata.
+
+        Returns:
+            {thread_id: thread resource}. A thread that could not be fetched
+            maps to {"error": {...}}.
+        """
+        query = urlencode(_format_params(format_, metadata_headers), doseq=True)
+        results = self.batch_execute([("GET", f"/users/me/threads/{tid}?{query}", None) for tid in thread_ids])
+        return dict(zip(thread_ids, results))
 
     def modify_thread(
         self,
@@ -78,33 +177,64 @@ class ThreadsMixin:
         Returns:
             Modified thread resource.
         """
-        payload: dict[str, Any] = {}
-        if add_label_ids is not None:
-            payload["addLabelIds"] = add_label_ids
-        if remove_label_ids is not None:
-            payload["removeLabelIds"] = remove_label_ids
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        payload = _label_payload(add_label_ids, remove_label_ids)
         return self._post(f"/users/me/threads/{thread_id}/modify", json=payload)
 
-    def trash_thread(self, thread_id: str) -> dict[str, Any]:
+    def batch_modify_threads(
+        self,
+        thread_ids: list[str],
+        add_label_ids: list[str] | None = None,
+        remove_label_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Apply the same label change to many threads through the batch endpoint.
+
+        Gmail has no threads.batchModify, so this sends one modify call per
+        thread, 50 per HTTP request, all sharing a single serialized payload.
+
+        Args:
+            thread_ids: List of thread IDs.
+            add_label_ids: Labels to add.
+            remove_label_ids: Labels to remove.
+
+        Returns:
+            Modified thread resources (or {"error": {...}}) in input order.
+        """
+        for thread_id in thread_ids:
+            _thread_cache_invalidate(self._thread_cache, thread_id)
+        payload = _json.dumps(_label_payload(add_label_ids, remove_label_ids))
+        return self.batch_execute([("POST", f"/users/me/threads/{tid}/modify", payload) for tid in thread_ids])
+
+    def trash_thread(self, thread_id: str, return_body: bool = True) -> dict[str, Any] | int:
         """POST /users/me/threads/{id}/trash — Move thread to trash.
 
         Args:
             thread_id: The thread ID.
+            return_body: If False, skip decoding the response and return
+                only the HTTP status code.
 
         Returns:
-            Trashed thread resource.
+            Trashed thread resource, or the status code if return_body is False.
         """
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        if not return_body:
+            return self._post_status(f"/users/me/threads/{thread_id}/trash")
         return self._post(f"/users/me/threads/{thread_id}/trash")
 
-    def untrash_thread(self, thread_id: str) -> dict[str, Any]:
+    def untrash_thread(self, thread_id: str, return_body: bool = True) -> dict[str, Any] | int:
         """POST /users/me/threads/{id}/untrash — Remove thread from trash.
 
         Args:
             thread_id: The thread ID.
+            return_body: If False, skip decoding the response and return
+                only the HTTP status code.
 
         Returns:
-            Untrashed thread resource.
+            Untrashed thread resource, or the status code if return_body is False.
         """
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        if not return_body:
+            return self._post_status(f"/users/me/threads/{thread_id}/untrash")
         return self._post(f"/users/me/threads/{thread_id}/untrash")
 
     def delete_thread(self, thread_id: str) -> int:
@@ -116,4 +246,182 @@ class ThreadsMixin:
         Returns:
             HTTP status code (204 on success).
         """
+        _thread_cache_invalidate(self._thread_cache, thread_id)
         return self._delete(f"/users/me/threads/{thread_id}")
+
+
+class AsyncThreadsMixin:
+    """Async counterpart of :class:`ThreadsMixin`."""
+
+    async def list_threads(
+        self,
+        query: str | None = None,
+        max_results: int = 10,
+        label_ids: list[str] | None = None,
+        page_token: str | None = None,
+        include_spam_trash: bool = False,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`ThreadsMixin.list_threads`."""
+        params = _list_params(query, max_results, label_ids, page_token, include_spam_trash)
+        return await self._get("/users/me/threads", params=params)
+
+    async def get_thread(
+        self,
+        thread_id: str,
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+        use_cache: bool = False,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`ThreadsMixin.get_thread`."""
+        params = _format_params(format_, metadata_headers)
+        if not use_cache:
+            return await self._get(f"/users/me/threads/{thread_id}", params=params)
+        key = _thread_cache_key(thread_id, format_, metadata_headers)
+        if (thread := _thread_cache_get(self._thread_cache, key)) is not None:
+            return thread
+        thread = await self._get(f"/users/me/threads/{thread_id}", params=params)
+        _thread_cache_put(self._thread_cache, key, thread)
+        return thread
+
+    async def iter_thread_items(
+        self,
+        thread_id: str,
+        prefix: str = "messages.item",
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Async version of :meth:`ThreadsMixin.iter_thread_items`."""
+        params = _format_params(format_, metadata_headers)
+        async with self._stream("GET", f"/users/me/threads/{thread_id}", params=params) as resp:
+            async for item in _json.aiter_items(resp.aiter_bytes(), prefix):
+                yield item
+
+    async def batch_get_threads(
+        self,
+        thread_ids: list[str],
+        format_: str = "full",
+        metadata_headers: list[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Async version of :meth:`ThreadsMixin.batch_get_threads`."""
+        query = urlencode(_format_params(format_, metadata_headers), doseq=True)
+        results = await self.batch_execute([("GET", f"/users/me/threads/{tid}?{query}", None) for tid in thread_ids])
+        return dict(zip(thread_ids, results))
+
+    async def iter_threads_full(
+        self,
+        query: str | None = None,
+        label_ids: list[str] | None = None,
+        page_size: int = 100,
+        format_: str = "metadata",
+        metadata_headers: list[str] | None = None,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every matching thread with its messages, page by page.
+
+        Each page of IDs is fetched through the batch endpoint, and the
+        listing for the next page runs concurrently with that fetch, so no
+        RTT is spent waiting on list_threads between pages.
+
+        Args:
+            query: Gmail search query.
+            label_ids: Only return threads with all of these label IDs.
+            page_size: Threads per page (max 500).
+            format_: Thread format: full, metadata, or minimal.
+            metadata_headers: Headers to include when format=metadata.
+            max_pages: Stop after this many pages.
+        """
+        page = await self.list_threads(query, page_size, label_ids)
+        pages = 1
+        pending: asyncio.Future[dict[str, Any]] | None = None
+        try:
+            while True:
+                token = page.get("nextPageToken")
+                if token and (max_pages is None or pages < max_pages):
+                    pending = asyncio.ensure_future(self.list_threads(query, page_size, label_ids, token))
+                ids = [t["id"] for t in page.get("threads", ())]
+                threads = await self.batch_get_threads(ids, format_, metadata_headers) if ids else {}
+                for thread_id in ids:
+                    yield threads[thread_id]
+                if pending is None:
+                    return
+                page, pending = await pending, None
+                pages += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def modify_thread(
+        self,
+        thread_id: str,
+        add_label_ids: list[str] | None = None,
+        remove_label_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of :meth:`ThreadsMixin.modify_thread`."""
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        payload = _label_payload(add_label_ids, remove_label_ids)
+        return await self._post(f"/users/me/threads/{thread_id}/modify", json=payload)
+
+    async def batch_modify_threads(
+        self,
+        thread_ids: list[str],
+        add_label_ids: list[str] | None = None,
+        remove_label_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async version of :meth:`ThreadsMixin.batch_modify_threads`."""
+        for thread_id in thread_ids:
+            _thread_cache_invalidate(self._thread_cache, thread_id)
+        payload = _json.dumps(_label_payload(add_label_ids, remove_label_ids))
+        return await self.batch_execute([("POST", f"/users/me/threads/{tid}/modify", payload) for tid in thread_ids])
+
+    async def trash_thread(self, thread_id: str, return_body: bool = True) -> dict[str, Any] | int:
+        """Async version of :meth:`ThreadsMixin.trash_thread`."""
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        if not return_body:
+            return await self._post_status(f"/users/me/threads/{thread_id}/trash")
+        return await self._post(f"/users/me/threads/{thread_id}/trash")
+
+    async def untrash_thread(self, thread_id: str, return_body: bool = True) -> dict[str, Any] | int:
+        """Async version of :meth:`ThreadsMixin.untrash_thread`."""
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        if not return_body:
+            return await self._post_status(f"/users/me/threads/{thread_id}/untrash")
+        return await self._post(f"/users/me/threads/{thread_id}/untrash")
+
+    async def delete_thread(self, thread_id: str) -> int:
+        """Async version of :meth:`ThreadsMixin.delete_thread`."""
+        _thread_cache_invalidate(self._thread_cache, thread_id)
+        return await self._delete(f"/users/me/threads/{thread_id}")
+
+    async def gather_delete_threads(
+        self,
+        thread_ids: list[str],
+        concurrency: int = 10,
+        max_retries: int = 3,
+    ) -> list[int | BaseException]:
+        """Permanently delete many threads concurrently, at most ``concurrency`` in flight.
+
+        A request answered with 429 is retried up to ``max_retries`` times with
+        exponential backoff starting at RATE_LIMIT_BACKOFF seconds.
+
+        Args:
+            thread_ids: List of thread IDs.
+            concurrency: Maximum number of simultaneous DELETE requests.
+            max_retries: Retries per thread after a 429 response.
+
+        Returns:
+            In the order of thread_ids, the HTTP status code (204 on success)
+            or the exception that deleting that thread raised.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _delete(thread_id: str) -> int:
+            async with sem:
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await self.delete_thread(thread_id)
+                    except GmailAPIError as exc:
+                        if exc.status_code != 429 or attempt == max_retries:
+                            raise
+                    await asyncio.sleep(RATE_LIMIT_BACKOFF * 2**attempt)
+
+        return list(await asyncio.gather(*(_delete(tid) for tid in thread_ids), return_exceptions=True))
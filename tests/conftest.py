@@ -2,21 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 
-from gmail_sdk import GmailClient
+from gmail_sdk import AsyncGmailClient, GmailClient
 from gmail_sdk.client import DEFAULT_SECRETS_DIR
 
 
 DEFAULT_ACCOUNT = "draneylucas"
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+API_BASE_URL = "https://gmail.googleapis.com/gmail/v1"
+
+# Exact API paths (relative to /gmail/v1) served by mock_client.
+_FIXTURE_ROUTES = {
+    "/users/me/profile": "profile.json",
+    "/users/me/labels": "labels.json",
+    "/users/me/messages": "messages_list.json",
+    "/users/me/threads": "threads_list.json",
+}
+
+# Path prefixes for single-resource GETs, e.g. /users/me/threads/{id}.
+_FIXTURE_PREFIXES = {
+    "/users/me/messages/": "message.json",
+    "/users/me/threads/": "thread.json",
+}
+
+# Raw response bodies, read once at import. They are served as bytes, so the
+# only parse per request is the client's own, exactly as against the real API.
+_FIXTURE_BYTES = {path.name: path.read_bytes() for path in FIXTURES_DIR.glob("*.json")}
+
+
+def _fixture_for(path: str) -> str | None:
+    path = path.removeprefix("/gmail/v1")
+    if path in _FIXTURE_ROUTES:
+        return _FIXTURE_ROUTES[path]
+    for prefix, name in _FIXTURE_PREFIXES.items():
+        if path.startswith(prefix):
+            return name
+    return None
+
+
+def _fixture_handler(request: httpx.Request) -> httpx.Response:
+    name = _fixture_for(request.url.path)
+    if name is None:
+        return httpx.Response(404, json={"error": {"message": f"no fixture for {request.url.path}"}})
+    return httpx.Response(200, content=_FIXTURE_BYTES[name], headers={"Content-Type": "application/json"})
+
 
 @pytest.fixture(scope="session")
 def client() -> GmailClient:
-    """Session-scoped Gmail client for integration tests."""
+    """Session-scoped Gmail client for the live tests marked ``remote``.
+
+    One client per session means one token refresh and one TLS handshake for
+    the whole run. That is safe because the remote tests only read (list_*,
+    get_*) and the suite does not run them in parallel; a test that mutates
+    the mailbox or client state should build its own client instead.
+    """
     secrets_dir = os.environ.get("GMAIL_SECRETS_DIR", DEFAULT_SECRETS_DIR)
     account = os.environ.get("GMAIL_TEST_ACCOUNT", DEFAULT_ACCOUNT)
 
@@ -28,3 +77,95 @@ def client() -> GmailClient:
         )
 
     return GmailClient(account=account, secrets_dir=secrets_dir)
+
+
+@pytest.fixture(scope="session")
+def warmup(client: GmailClient) -> dict[str, Any]:
+    """Live labels, message and thread listings and profile, fetched concurrently once per session.
+
+    The remote tests read from this instead of each paying its own round
+    trip, so the session costs roughly the slowest of the four calls.
+    """
+
+    async def _fetch() -> dict[str, Any]:
+        # The token is already in the process-wide cache from `client`.
+        async with AsyncGmailClient(account=client.account, secrets_dir=client.secrets_dir) as async_client:
+            labels, messages, threads, profile = await asyncio.gather(
+                async_client.list_labels(),
+                async_client.list_messages(max_results=5),
+                async_client.list_threads(max_results=5),
+                async_client.get_profile(),
+            )
+        return {"labels": labels, "messages": messages, "threads": threads, "profile": profile}
+
+    return asyncio.run(_fetch())
+
+
+# On an empty mailbox these skip during setup. pytest caches the skip for the
+# session, so every test that needs an ID is skipped without another probe.
+
+
+@pytest.fixture(scope="session")
+def first_message_id(warmup: dict[str, Any]) -> str:
+    """ID of the newest live message."""
+    messages = warmup["messages"].get("messages")
+    if not messages:
+        pytest.skip("empty inbox")
+    return messages[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def first_thread_id(warmup: dict[str, Any]) -> str:
+    """ID of the newest live thread."""
+    threads = warmup["threads"].get("threads")
+    if not threads:
+        pytest.skip("empty inbox")
+    return threads[0]["id"]
+
+
+@pytest.fixture
+def make_client() -> Callable[..., GmailClient]:
+    """Factory for GmailClients whose requests are answered by a mock handler.
+
+    ``make_client(handler, **kwargs)`` passes kwargs to GmailClient and routes
+    every request through ``httpx.MockTransport(handler)``.
+    """
+
+    def _make(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> GmailClient:
+        client = GmailClient(**kwargs)
+        client._http.close()  # release the pool built by __init__ before swapping it out
+        client._http = httpx.Client(
+            base_url=API_BASE_URL,
+            transport=httpx.MockTransport(handler),
+            headers=client._http.headers,
+        )
+        return client
+
+    return _make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncGmailClient]:
+    """Async counterpart of make_client; handler may be sync or async.
+
+    Call it outside the event loop (as the async tests do, before
+    asyncio.run), since closing the replaced AsyncClient runs its own loop.
+    """
+
+    def _make(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> AsyncGmailClient:
+        client = AsyncGmailClient(**kwargs)
+        asyncio.run(client._http.aclose())
+        client._http = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            transport=httpx.MockTransport(handler),
+            headers=client._http.headers,
+        )
+        return client
+
+    return _make
+
+
+@pytest.fixture
+def mock_client(make_client: Callable[..., GmailClient]) -> GmailClient:
+    """Gmail client that answers GETs with canned JSON from tests/fixtures."""
+    return make_client(_fixture_handler, access_token="test-token")
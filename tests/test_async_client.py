@@ -0,0 +1,264 @@
+"""Unit tests for AsyncGmailClient."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from email import message_from_bytes
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from gmail_sdk import AsyncGmailClient, GmailAPIError
+
+
+def _decode_raw(raw: str):
+    return message_from_bytes(base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)))
+
+
+class TestAsyncHelpers:
+    def test_get_returns_parsed_json(self, make_async_client):
+        client = make_async_client(
+            lambda request: httpx.Response(200, json={"emailAddress": "me@example.com"}),
+            access_token="tok",
+        )
+        assert asyncio.run(client.get_profile()) == {"emailAddress": "me@example.com"}
+
+    def test_raises_api_error(self, make_async_client):
+        client = make_async_client(
+            lambda request: httpx.Response(404, json={"error": {"message": "Not Found"}}),
+            access_token="tok",
+        )
+        with pytest.raises(GmailAPIError) as exc_info:
+            asyncio.run(client.get_message("missing"))
+        assert exc_info.value.status_code == 404
+
+    def test_gather_overlaps_requests(self, make_async_client):
+        paths = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        client = make_async_client(_handler, access_token="tok")
+
+        async def _run():
+            async with client:
+                return await asyncio.gather(*(client.get_message(i) for i in ["a", "b", "c"]))
+
+        results = asyncio.run(_run())
+        assert [r["id"] for r in results] == ["a", "b", "c"]
+        assert client._http.is_closed
+
+    def test_refreshes_and_retries_once_on_401(self, monkeypatch, make_async_client):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            if request.headers["Authorization"] == "Bearer old":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"ok": True})
+
+        client = make_async_client(_handler, access_token="old")
+        client.account = "acct"
+        monkeypatch.setattr(
+            client, "_load_and_refresh_token", lambda account, secrets_dir, stale_token=None: "new"
+        )
+        assert asyncio.run(client._get("/users/me/profile")) == {"ok": True}
+        assert client.access_token == "new"
+
+
+class TestAsyncConvenience:
+    def test_reply_all_excludes_self(self):
+        client = AsyncGmailClient(access_token="tok")
+        client.get_message = AsyncMock(return_value={
+            "threadId": "thread1",
+            "payload": {"headers": [
+                {"name": "From", "value": "alice@example.com"},
+                {"name": "To", "value": "me@example.com, bob@example.com"},
+                {"name": "Subject", "value": "Plans"},
+                {"name": "Message-ID", "value": "<id@example.com>"},
+            ]},
+        })
+        client.get_profile = AsyncMock(return_value={"emailAddress": "Me@Example.com"})
+        client.send_raw_message = AsyncMock(return_value={"id": "sent1"})
+
+        assert asyncio.run(client.reply_all("msg1", body="Sounds good")) == {"id": "sent1"}
+        kwargs = client.send_raw_message.call_args.kwargs
+        assert kwargs["thread_id"] == "thread1"
+        msg = _decode_raw(kwargs["raw"])
+        assert msg["To"] == "alice@example.com"
+        assert msg["Cc"] == "bob@example.com"
+        assert msg["Subject"] == "Re: Plans"
+
+    def test_mark_as_read_calls_modify(self):
+        client = AsyncGmailClient(access_token="tok")
+        client.modify_message = AsyncMock(return_value={"id": "msg1"})
+        assert asyncio.run(client.mark_as_read("msg1")) == {"id": "msg1"}
+        client.modify_message.assert_awaited_once_with("msg1", remove_label_ids=["UNREAD"])
+
+
+class TestAsyncGatherGetMessages:
+    def test_preserves_order_and_bounds_concurrency(self, make_async_client):
+        in_flight = 0
+        peak = 0
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        client = make_async_client(_handler, access_token="tok")
+        ids = [f"m{i}" for i in range(10)]
+        results = asyncio.run(client.gather_get_messages(ids, format_="minimal", concurrency=3))
+        assert [r["id"] for r in results] == ids
+        assert peak == 3
+
+
+class TestAsyncDraftsAndLabels:
+    def test_create_draft_posts_message(self, make_async_client):
+        seen = {}
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen["path"] = request.url.path
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"id": "d1"})
+
+        client = make_async_client(_handler, access_token="tok")
+        result = asyncio.run(client.create_draft(to="a@example.com", subject="Hi", body="x", thread_id="t1"))
+        assert result == {"id": "d1"}
+        assert seen["path"] == "/gmail/v1/users/me/drafts"
+        assert seen["body"]["message"]["threadId"] == "t1"
+        assert _decode_raw(seen["body"]["message"]["raw"])["To"] == "a@example.com"
+
+    def test_update_label_sends_only_provided_fields(self, make_async_client):
+        seen = {}
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen["method"] = request.method
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"id": "L1"})
+
+        client = make_async_client(_handler, access_token="tok")
+        asyncio.run(client.update_label("L1", name="Renamed"))
+        assert seen == {"method": "PATCH", "body": {"id": "L1", "name": "Renamed"}}
+
+
+class TestAsyncIterPages:
+    def test_iter_messages_follows_page_tokens(self, make_async_client):
+        pages = {
+            None: {"messages": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"},
+            "p2": {"messages": [{"id": "c"}]},
+        }
+        seen_params = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen_params.append(dict(request.url.params))
+            return httpx.Response(200, json=pages[request.url.params.get("pageToken")])
+
+        client = make_async_client(_handler, access_token="tok")
+
+        async def _collect():
+            return [m["id"] async for m in client.iter_messages(query="is:unread", page_size=2)]
+
+        assert asyncio.run(_collect()) == ["a", "b", "c"]
+        assert seen_params[0] == {"q": "is:unread", "maxResults": "2"}
+        assert seen_params[1]["pageToken"] == "p2"
+
+    def test_next_page_requested_before_current_is_consumed(self, make_async_client):
+        requested = []
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            token = request.url.params.get("pageToken")
+            requested.append(token)
+            if token is None:
+                return httpx.Response(200, json={"drafts": [{"id": "d1"}], "nextPageToken": "p2"})
+            return httpx.Response(200, json={"drafts": [{"id": "d2"}]})
+
+        client = make_async_client(_handler, access_token="tok")
+
+        async def _run():
+            drafts = client.iter_drafts()
+            first = await drafts.__anext__()
+            await asyncio.sleep(0)
+            snapshot = list(requested)
+            rest = [d async for d in drafts]
+            return first, snapshot, rest
+
+        first, snapshot, rest = asyncio.run(_run())
+        assert first == {"id": "d1"}
+        assert snapshot == [None, "p2"]
+        assert rest == [{"id": "d2"}]
+
+    def test_iter_history_keeps_start_history_id(self, make_async_client):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["startHistoryId"] == "100"
+            if request.url.params.get("pageToken"):
+                return httpx.Response(200, json={"history": [{"id": "102"}], "historyId": "105"})
+            return httpx.Response(200, json={"history": [{"id": "101"}], "nextPageToken": "n", "historyId": "105"})
+
+        client = make_async_client(_handler, access_token="tok")
+
+        async def _collect():
+            return [h["id"] async for h in client.iter_history("100")]
+
+        assert asyncio.run(_collect()) == ["101", "102"]
+
+
+class TestAsyncThreads:
+    def test_gather_get_thread(self, make_async_client):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["format"] == "minimal"
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        client = make_async_client(_handler, access_token="tok")
+
+        async def _run():
+            return await asyncio.gather(*(client.get_thread(t, format_="minimal") for t in ["t1", "t2"]))
+
+        assert asyncio.run(_run()) == [{"id": "t1"}, {"id": "t2"}]
+
+    def test_modify_thread_posts_label_payload(self, make_async_client):
+        seen = {}
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen["path"] = request.url.path
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"id": "t1"})
+
+        client = make_async_client(_handler, access_token="tok")
+        asyncio.run(client.modify_thread("t1", remove_label_ids=["INBOX"]))
+        assert seen == {"path": "/gmail/v1/users/me/threads/t1/modify", "body": {"removeLabelIds": ["INBOX"]}}
+
+    def test_iter_thread_items_streams_messages(self, make_async_client):
+        pytest.importorskip("ijson")
+        body = b'{"id":"t1","messages":[{"id":"m1"},{"id":"m2"}]}'
+        client = make_async_client(lambda request: httpx.Response(200, content=body), access_token="tok")
+
+        async def _run():
+            return [m["id"] async for m in client.iter_thread_items("t1")]
+
+        assert asyncio.run(_run()) == ["m1", "m2"]
+
+    def test_gather_delete_threads_retries_rate_limits(self, monkeypatch, make_async_client):
+        from gmail_sdk import threads
+
+        monkeypatch.setattr(threads, "RATE_LIMIT_BACKOFF", 0)
+        attempts = {}
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            tid = request.url.path.rsplit("/", 1)[-1]
+            attempts[tid] = attempts.get(tid, 0) + 1
+            if tid == "busy" and attempts[tid] < 3:
+                return httpx.Response(429, json={"error": {"message": "Rate Limit Exceeded"}})
+            if tid == "gone":
+                return httpx.Response(404, json={"error": {"message": "Not Found"}})
+            return httpx.Response(204)
+
+        client = make_async_client(_handler, access_token="tok")
+        results = asyncio.run(client.gather_delete_threads(["t1", "busy", "gone"], concurrency=2))
+        assert results[:2] == [204, 204]
+        assert isinstance(results[2], GmailAPIError) and results[2].status_code == 404
+        assert attempts == {"t1": 1, "busy": 3, "gone": 1}
@@ -51,3 +51,236 @@ class TestTokenPathResolution:
         token_path = tmp_path / "gmail-testaccount.json"
         mode = token_path.stat().st_mode
         assert stat.S_IMODE(mode) == 0o600
+
+    def test_save_replaces_loose_file_and_leaves_no_temp(self, tmp_path):
+        import stat
+        token_path = tmp_path / "gmail-testaccount.json"
+        token_path.write_text("{}")
+        token_path.chmod(0o644)
+        AuthMixin._save_token("testaccount", str(tmp_path), {"access_token": "fresh"})
+        assert stat.S_IMODE(token_path.stat().st_mode) == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["gmail-testaccount.json"]
+
+    def test_unchanged_token_is_not_rewritten(self, tmp_path):
+        token_data = {"access_token": "test123", "expires_at": 9999999999}
+        AuthMixin._save_token("testaccount", str(tmp_path), token_data)
+        token_path = tmp_path / "gmail-testaccount.json"
+        token_path.write_text('{"marker": true}')
+        # Saving identical data again must not touch the file.
+        AuthMixin._save_token("testaccount", str(tmp_path), dict(token_data))
+        assert token_path.read_text() == '{"marker": true}'
+
+        AuthMixin._save_token("testaccount", str(tmp_path), {**token_data, "access_token": "new"})
+        assert AuthMixin._load_token("testaccount", str(tmp_path))["access_token"] == "new"
+
+    def test_rewrites_when_file_was_removed(self, tmp_path):
+        token_data = {"access_token": "test123"}
+        AuthMixin._save_token("testaccount", str(tmp_path), token_data)
+        (tmp_path / "gmail-testaccount.json").unlink()
+        AuthMixin._save_token("testaccount", str(tmp_path), token_data)
+        assert AuthMixin._load_token("testaccount", str(tmp_path)) == token_data
+
+
+class TestTokenMemCache:
+    def setup_method(self):
+        AuthMixin.clear_token_cache()
+
+    def teardown_method(self):
+        AuthMixin.clear_token_cache()
+
+    def test_fresh_token_served_from_memory(self, tmp_path, monkeypatch):
+        import time
+        token_data = {"access_token": "cached", "expires_at": time.time() + 3600}
+        AuthMixin._save_token("acct", str(tmp_path), token_data)
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "cached"
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("token file should not be re-read")
+
+        monkeypatch.setattr(AuthMixin, "_load_token", staticmethod(_fail))
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "cached"
+
+    def test_clear_token_cache_forces_disk_reload(self, tmp_path):
+        import time
+        AuthMixin._save_token(
+            "acct", str(tmp_path), {"access_token": "old", "expires_at": time.time() + 3600}
+        )
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "old"
+        AuthMixin._save_token(
+            "acct", str(tmp_path), {"access_token": "new", "expires_at": time.time() + 3600}
+        )
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "old"
+        AuthMixin.clear_token_cache()
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "new"
+
+    def test_concurrent_refresh_hits_token_endpoint_once(self, tmp_path, monkeypatch):
+        import json
+        import threading
+        import time
+
+        (tmp_path / "credentials.json").write_text(
+            json.dumps({"installed": {"client_id": "id", "client_secret": "secret"}})
+        )
+        AuthMixin._save_token(
+            "acct", str(tmp_path), {"access_token": "stale", "refresh_token": "r", "expires_at": 0}
+        )
+        calls = []
+
+        def _refresh(client_id, client_secret, refresh_token):
+            calls.append(refresh_token)
+            time.sleep(0.05)
+            return {"access_token": "fresh", "expires_at": time.time() + 3600}
+
+        monkeypatch.setattr(AuthMixin, "refresh_access_token", staticmethod(_refresh))
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    AuthMixin._load_and_refresh_token("acct", str(tmp_path))
+                )
+            )
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["fresh"] * 5
+        assert len(calls) == 1
+
+    def test_stale_token_forces_refresh(self, tmp_path, monkeypatch):
+        import json
+        import time
+
+        (tmp_path / "credentials.json").write_text(
+            json.dumps({"installed": {"client_id": "id", "client_secret": "secret"}})
+        )
+        AuthMixin._save_token(
+            "acct",
+            str(tmp_path),
+            {"access_token": "revoked", "refresh_token": "r", "expires_at": time.time() + 3600},
+        )
+        monkeypatch.setattr(
+            AuthMixin,
+            "refresh_access_token",
+            staticmethod(lambda **kw: {"access_token": "fresh", "expires_at": time.time() + 3600}),
+        )
+        assert AuthMixin._load_and_refresh_token("acct", str(tmp_path)) == "revoked"
+        token = AuthMixin._load_and_refresh_token("acct", str(tmp_path), stale_token="revoked")
+        assert token == "fresh"
+
+
+class TestRefreshSkew:
+    def test_reads_env(self, monkeypatch):
+        from gmail_sdk import auth
+
+        monkeypatch.setenv("GMAIL_TOKEN_REFRESH_SKEW", "120")
+        assert auth._refresh_skew_from_env() == 120
+
+    def test_malformed_env_falls_back_to_default(self, monkeypatch):
+        from gmail_sdk import auth
+
+        for value in ("", "1m", "sixty"):
+            monkeypatch.setenv("GMAIL_TOKEN_REFRESH_SKEW", value)
+            assert auth._refresh_skew_from_env() == 60
+
+
+class TestTokenEndpointClient:
+    def test_refresh_reuses_shared_client(self, monkeypatch):
+        import httpx
+        from gmail_sdk import auth
+
+        requests = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "new", "expires_in": 3600})
+
+        shared = httpx.Client(transport=httpx.MockTransport(_handler))
+        monkeypatch.setattr(auth, "_TOKEN_HTTP", shared)
+
+        for _ in range(2):
+            data = AuthMixin.refresh_access_token("id", "secret", "refresh")
+            assert data["access_token"] == "new"
+        assert auth._token_http() is shared
+        assert [str(r.url) for r in requests] == [auth.GOOGLE_TOKEN_URL] * 2
+
+
+class TestAuthorize:
+    def test_uses_ephemeral_loopback_port(self, tmp_path, monkeypatch):
+        import json
+        import threading
+        import time
+        from urllib.parse import parse_qs, urlparse
+
+        import httpx
+
+        (tmp_path / "credentials.json").write_text(
+            json.dumps({"installed": {"client_id": "id", "client_secret": "secret"}})
+        )
+        opened = []
+
+        def _open(url):
+            opened.append(url)
+            redirect = parse_qs(urlparse(url).query)["redirect_uri"][0]
+            threading.Thread(target=httpx.get, args=(f"{redirect}/?code=the-code",)).start()
+
+        exchanged = {}
+
+        def _exchange(code, client_id, client_secret, redirect_uri=REDIRECT_URI):
+            exchanged.update(code=code, redirect_uri=redirect_uri)
+            return {"access_token": "tok", "refresh_token": "r", "expires_at": time.time() + 3600}
+
+        monkeypatch.setattr("webbrowser.open", _open)
+        monkeypatch.setattr(AuthMixin, "exchange_code", staticmethod(_exchange))
+
+        client = AuthMixin.authorize(account="acct", secrets_dir=str(tmp_path))
+        try:
+            redirect = parse_qs(urlparse(opened[0]).query)["redirect_uri"][0]
+            assert redirect != REDIRECT_URI
+            assert exchanged == {"code": "the-code", "redirect_uri": redirect}
+            assert client.access_token == "tok"
+        finally:
+            client.close()
+            AuthMixin.clear_token_cache()
+
+
+class TestLoadCredentials:
+    def test_reuses_parsed_file_until_mtime_changes(self, tmp_path, monkeypatch):
+        import builtins
+        import json
+        import os
+
+        creds_path = tmp_path / "credentials.json"
+        creds_path.write_text(json.dumps({"installed": {"client_id": "one"}}))
+        assert AuthMixin._load_credentials(str(tmp_path))["client_id"] == "one"
+
+        opens = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda *a, **kw: opens.append(a) or real_open(*a, **kw))
+        assert AuthMixin._load_credentials(str(tmp_path))["client_id"] == "one"
+        assert opens == []
+
+        creds_path.write_text(json.dumps({"web": {"client_id": "two"}}))
+        st = creds_path.stat()
+        os.utime(creds_path, (st.st_atime, st.st_mtime + 10))
+        assert AuthMixin._load_credentials(str(tmp_path))["client_id"] == "two"
+        assert len(opens) == 1
+
+    def test_returns_shared_inner_config(self, tmp_path):
+        import json
+
+        (tmp_path / "credentials.json").write_text(json.dumps({"installed": {"client_id": "one"}}))
+        first = AuthMixin._load_credentials(str(tmp_path))
+        assert first == {"client_id": "one"}
+        assert AuthMixin._load_credentials(str(tmp_path)) is first
+
+    def test_rejects_unknown_config(self, tmp_path):
+        import json
+
+        import pytest
+
+        (tmp_path / "credentials.json").write_text(json.dumps({"other": {}}))
+        with pytest.raises(ValueError):
+            AuthMixin._load_credentials(str(tmp_path))
@@ -0,0 +1,322 @@
+"""Unit tests for the multipart/mixed batch helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+
+import httpx
+import pytest
+
+from gmail_sdk import GmailAPIError
+from gmail_sdk.batch import BATCH_LIMIT, build_batch_body, parse_batch_response
+
+
+def _batch_response(parts: list[tuple[int, int, dict | None]], boundary: str = "batch_resp") -> httpx.Response:
+    """Build a batch response from (item index, status, body) tuples."""
+    chunks = []
+    for index, status, body in parts:
+        payload = json.dumps(body) if body is not None else ""
+        chunks.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <response-item{index}>\r\n\r\n"
+            f"HTTP/1.1 {status} OK\r\n"
+            f"Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{payload}\r\n"
+        )
+    chunks.append(f"--{boundary}--\r\n")
+    return httpx.Response(
+        200,
+        content="".join(chunks).encode(),
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+    )
+
+
+class TestBuildBatchBody:
+    def test_encodes_each_request_as_application_http(self):
+        body = build_batch_body(
+            [
+                ("GET", "/users/me/messages/a?format=minimal", None),
+                ("POST", "/users/me/messages/b/modify", {"removeLabelIds": ["UNREAD"]}),
+            ],
+            "xyz",
+        ).decode()
+        assert body.count("--xyz\r\n") == 2
+        assert body.endswith("--xyz--\r\n")
+        assert "Content-ID: <item0>" in body
+        assert "GET /gmail/v1/users/me/messages/a?format=minimal HTTP/1.1" in body
+        assert "POST /gmail/v1/users/me/messages/b/modify HTTP/1.1" in body
+        assert '{"removeLabelIds":["UNREAD"]}' in body
+
+
+class TestParseBatchResponse:
+    def test_orders_by_content_id(self):
+        resp = _batch_response([(1, 200, {"id": "b"}), (0, 200, {"id": "a"})])
+        results = parse_batch_response(resp.content, resp.headers["Content-Type"], 2)
+        assert results == [{"id": "a"}, {"id": "b"}]
+
+    def test_failed_part_returns_error_body(self):
+        resp = _batch_response([
+            (0, 200, {"id": "a"}),
+            (1, 404, {"error": {"code": 404, "message": "Not Found"}}),
+        ])
+        results = parse_batch_response(resp.content, resp.headers["Content-Type"], 2)
+        assert results[1]["error"]["code"] == 404
+
+    def test_empty_success_body(self):
+        resp = _batch_response([(0, 204, None)])
+        assert parse_batch_response(resp.content, resp.headers["Content-Type"], 1) == [{}]
+
+
+class TestBatchExecute:
+    def test_splits_into_batches_of_limit(self, make_client):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert str(request.url) == "https://gmail.googleapis.com/batch/gmail/v1"
+            assert request.headers["Content-Type"].startswith("multipart/mixed; boundary=")
+            count = request.content.count(b"Content-Type: application/http")
+            calls.append(count)
+            return _batch_response([(i, 200, {"n": i}) for i in range(count)])
+
+        client = make_client(handler, access_token="tok")
+        ids = [f"m{i}" for i in range(BATCH_LIMIT + 5)]
+        results = client.batch_get_messages(ids, format_="minimal")
+        assert calls == [BATCH_LIMIT, 5]
+        assert len(results) == BATCH_LIMIT + 5
+
+    def test_batch_trash_messages(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert b"POST /gmail/v1/users/me/messages/x/trash HTTP/1.1" in request.content
+            return _batch_response([(0, 200, {"id": "x", "labelIds": ["TRASH"]})])
+
+        client = make_client(handler, access_token="tok")
+        assert client.batch_trash_messages(["x"]) == [{"id": "x", "labelIds": ["TRASH"]}]
+
+    def test_empty_input_sends_nothing(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no request expected")
+
+        client = make_client(handler, access_token="tok")
+        assert client.batch_execute([]) == []
+
+
+class TestBatchDeletes:
+    def test_batch_delete_drafts_labels_filters(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.content)
+            return _batch_response([(0, 204, None), (1, 404, {"error": {"code": 404, "message": "Not Found"}})])
+
+        client = make_client(handler, access_token="tok")
+        assert client.batch_delete_drafts(["d1", "d2"])[0] == {}
+        assert client.batch_delete_labels(["L1", "L2"])[1]["error"]["code"] == 404
+        client.batch_delete_filters(["f1", "f2"])
+        assert b"DELETE /gmail/v1/users/me/drafts/d1 HTTP/1.1" in seen[0]
+        assert b"DELETE /gmail/v1/users/me/labels/L2 HTTP/1.1" in seen[1]
+        assert b"DELETE /gmail/v1/users/me/settings/filters/f1 HTTP/1.1" in seen[2]
+
+    def test_batch_delete_messages_chunks_at_1000(self, make_client):
+        sizes = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/gmail/v1/users/me/messages/batchDelete"
+            sizes.append(len(json.loads(request.content)["ids"]))
+            return httpx.Response(204)
+
+        client = make_client(handler, access_token="tok")
+        client.batch_delete_messages([f"m{i}" for i in range(2001)])
+        assert sizes == [1000, 1000, 1]
+
+
+class TestIterNewMessagesSince:
+    def test_batches_added_messages_and_skips_deleted(self, make_client):
+        history_pages = {
+            None: {
+                "history": [
+                    {"id": "1", "messagesAdded": [{"message": {"id": "a"}}, {"message": {"id": "b"}}]},
+                    {"id": "2", "messagesAdded": [{"message": {"id": "a"}}]},
+                ],
+                "nextPageToken": "p2",
+            },
+            "p2": {"history": [{"id": "3", "messagesAdded": [{"message": {"id": "c"}}]}]},
+        }
+        batches = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/history"):
+                assert request.url.params["historyTypes"] == "messageAdded"
+                return httpx.Response(200, json=history_pages[request.url.params.get("pageToken")])
+            ids = re.findall(rb"messages/(\w+)\?", request.content)
+            batches.append(ids)
+            return _batch_response([
+                (i, 404, {"error": {"code": 404, "message": "gone"}}) if mid == b"b" else (i, 200, {"id": mid.decode()})
+                for i, mid in enumerate(ids)
+            ])
+
+        client = make_client(handler, access_token="tok")
+        messages = list(client.iter_new_messages_since("100"))
+        assert [m["id"] for m in messages] == ["a", "c"]
+        assert batches == [[b"a", b"b", b"c"]]
+
+    def test_flushes_every_batch_limit(self, make_client):
+        ids = [f"m{i}" for i in range(BATCH_LIMIT + 1)]
+        page = {"history": [{"id": "1", "messagesAdded": [{"message": {"id": i}} for i in ids]}]}
+        sizes = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/history"):
+                return httpx.Response(200, json=page)
+            count = request.content.count(b"Content-Type: application/http")
+            sizes.append(count)
+            return _batch_response([(i, 200, {"id": str(i)}) for i in range(count)])
+
+        client = make_client(handler, access_token="tok")
+        assert len(list(client.iter_new_messages_since("1"))) == BATCH_LIMIT + 1
+        assert sizes == [BATCH_LIMIT, 1]
+
+
+class TestBatchGetThreads:
+    def test_returns_results_keyed_by_thread_id(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert b"GET /gmail/v1/users/me/threads/t2?format=minimal HTTP/1.1" in request.content
+            return _batch_response([(1, 200, {"id": "t2"}), (0, 200, {"id": "t1"})])
+
+        client = make_client(handler, access_token="tok")
+        assert client.batch_get_threads(["t1", "t2"], format_="minimal") == {
+            "t1": {"id": "t1"},
+            "t2": {"id": "t2"},
+        }
+
+    def test_falls_back_to_single_requests_on_5xx(self, make_client):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/batch/gmail/v1":
+                return httpx.Response(503, json={"error": {"message": "Backend Error"}})
+            paths.append(request.url.path)
+            if request.url.path.endswith("/t2"):
+                return httpx.Response(404, json={"error": {"message": "Not Found"}})
+            return httpx.Response(200, json={"id": "t1"})
+
+        client = make_client(handler, access_token="tok")
+        results = client.batch_get_threads(["t1", "t2"])
+        assert results["t1"] == {"id": "t1"}
+        assert results["t2"] == {"error": {"code": 404, "message": "Not Found"}}
+        assert paths == ["/gmail/v1/users/me/threads/t1", "/gmail/v1/users/me/threads/t2"]
+
+    def test_4xx_on_batch_endpoint_raises(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"error": {"message": "Bad Request"}})
+
+        with pytest.raises(GmailAPIError):
+            client = make_client(handler, access_token="tok")
+            client.batch_get_threads(["t1"])
+
+
+class TestAsyncBatchFallback:
+    def test_individual_requests_overlap_and_keep_order(self, monkeypatch, make_async_client):
+        from gmail_sdk import batch
+
+        monkeypatch.setattr(batch, "FALLBACK_CONCURRENCY", 3)
+        in_flight = []
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal peak
+            if request.url.path == "/batch/gmail/v1":
+                return httpx.Response(503, json={"error": {"message": "Backend Error"}})
+            tid = request.url.path.rsplit("/", 1)[1]
+            in_flight.append(tid)
+            peak = max(peak, len(in_flight))
+            # Finish in reverse order so the result ordering is actually exercised.
+            await asyncio.sleep(0.01 * (5 - int(tid[1:])))
+            in_flight.remove(tid)
+            if tid == "t3":
+                return httpx.Response(404, json={"error": {"message": "Not Found"}})
+            return httpx.Response(200, json={"id": tid})
+
+        client = make_async_client(handler, access_token="tok")
+        requests = [("GET", f"/users/me/threads/t{i}", None) for i in range(5)]
+
+        results = asyncio.run(client.batch_execute(requests))
+        assert peak == 3
+        assert results[3] == {"error": {"code": 404, "message": "Not Found"}}
+        assert [r.get("id") for r in results] == ["t0", "t1", "t2", None, "t4"]
+
+
+class TestAsyncIterThreadsFull:
+    def test_next_listing_overlaps_batch_fetch(self, make_async_client):
+        pages = {
+            None: {"threads": [{"id": "t1"}, {"id": "t2"}], "nextPageToken": "p2"},
+            "p2": {"threads": [{"id": "t3"}]},
+        }
+        events = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/threads"):
+                events.append(("list", request.url.params.get("pageToken")))
+                return httpx.Response(200, json=pages[request.url.params.get("pageToken")])
+            ids = re.findall(rb"threads/(\w+)\?", request.content)
+            events.append(("batch-start", len(ids)))
+            await asyncio.sleep(0.01)
+            events.append(("batch-end", len(ids)))
+            return _batch_response([(i, 200, {"id": tid.decode(), "messages": []}) for i, tid in enumerate(ids)])
+
+        client = make_async_client(handler, access_token="tok")
+
+        async def _collect():
+            return [t["id"] async for t in client.iter_threads_full(page_size=2)]
+
+        assert asyncio.run(_collect()) == ["t1", "t2", "t3"]
+        assert events.index(("list", "p2")) < events.index(("batch-end", 2))
+
+    def test_max_pages_stops_listing(self, make_async_client):
+        listed = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/threads"):
+                listed.append(request.url.params.get("pageToken"))
+                return httpx.Response(200, json={"threads": [{"id": "t"}], "nextPageToken": "more"})
+            return _batch_response([(0, 200, {"id": "t"})])
+
+        client = make_async_client(handler, access_token="tok")
+
+        async def _collect():
+            return [t async for t in client.iter_threads_full(max_pages=2)]
+
+        assert len(asyncio.run(_collect())) == 2
+        assert listed == [None, "more"]
+
+
+class TestBatchModifyThreads:
+    def test_shares_one_payload_across_parts(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.content)
+            return _batch_response([(0, 200, {"id": "t1"}), (1, 200, {"id": "t2"})])
+
+        client = make_client(handler, access_token="tok")
+        results = client.batch_modify_threads(["t1", "t2"], add_label_ids=["STARRED"], remove_label_ids=["INBOX"])
+        assert [r["id"] for r in results] == ["t1", "t2"]
+        body = seen[0]
+        assert b"POST /gmail/v1/users/me/threads/t2/modify HTTP/1.1" in body
+        assert body.count(b'{"addLabelIds":["STARRED"],"removeLabelIds":["INBOX"]}') == 2
+
+    def test_fallback_sends_prebuilt_json(self, make_client):
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/batch/gmail/v1":
+                return httpx.Response(500)
+            assert request.headers["Content-Type"] == "application/json"
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"id": "t1"})
+
+        client = make_client(handler, access_token="tok")
+        client.batch_modify_threads(["t1"], remove_label_ids=["UNREAD"])
+        assert bodies == [{"removeLabelIds": ["UNREAD"]}]
@@ -2,44 +2,39 @@
 
 from __future__ import annotations
 
+import base64
 import json
+from collections.abc import Callable
 
 import httpx
 import pytest
 
 from gmail_sdk import GmailClient, GmailAPIError
+from gmail_sdk import client as client_module
 
 
-def _make_transport(
+_PROFILE = {"emailAddress": "test@example.com", "messagesTotal": 42}
+_PROFILE_BYTES = b'{"emailAddress":"test@example.com","messagesTotal":42}'
+
+
+def _make_handler(
     status_code: int = 200,
     body: dict | None = None,
     content: bytes | None = None,
-) -> httpx.MockTransport:
-    """Build an httpx MockTransport that returns a fixed response."""
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a mock handler that returns a fixed response."""
+    headers = {}
+    if content is None and body is not None:
+        # Encode once, not on every request the transport serves
+        content = json.dumps(body).encode()
+        headers = {"Content-Type": "application/json"}
 
     def _handler(request: httpx.Request) -> httpx.Response:
         if content is not None:
-            return httpx.Response(status_code, content=content)
-        if body is not None:
-            return httpx.Response(
-                status_code,
-                content=json.dumps(body).encode(),
-                headers={"Content-Type": "application/json"},
-            )
+            return httpx.Response(status_code, content=content, headers=headers)
         return httpx.Response(status_code)
 
-    return httpx.MockTransport(_handler)
-
-
-def _client_with_transport(transport: httpx.MockTransport, **kwargs) -> GmailClient:
-    """Create a GmailClient whose internal httpx.Client uses the given transport."""
-    client = GmailClient(**kwargs)
-    client._http = httpx.Client(
-        base_url="https://gmail.googleapis.com/gmail/v1",
-        transport=transport,
-        headers=client._http.headers,
-    )
-    return client
+    return _handler
 
 
 class TestGmailClientAuth:
@@ -49,11 +44,47 @@ class TestGmailClientAuth:
         client = GmailClient(access_token="test-token-xxx")
         assert client._http.headers["Authorization"] == "Bearer test-token-xxx"
 
+    def test_apply_token_updates_live_header(self):
+        client = GmailClient(access_token="old-token")
+        client._apply_token("new-token")
+        assert client.access_token == "new-token"
+        assert client._http.headers["Authorization"] == "Bearer new-token"
+
     def test_no_args_creates_client_without_auth(self):
         client = GmailClient()
         assert "Authorization" not in client._http.headers
 
 
+class TestTransportConfig:
+    def test_connect_timeout_is_short(self):
+        client = GmailClient()
+        assert client._http.timeout.connect == 5.0
+        assert client._http.timeout.read == 60.0
+
+    def test_single_http2_pool_with_long_keepalive(self):
+        client = GmailClient()
+        pool = client._http._transport._pool
+        assert pool._http2 is True
+        assert pool._keepalive_expiry == 300.0
+
+    def test_requests_gzip_responses(self):
+        client = GmailClient()
+        assert "gzip" in client._http.headers["Accept-Encoding"]
+        assert client._http.headers["User-Agent"].endswith("(gzip)")
+
+    def test_prewarm_is_opt_in(self, monkeypatch, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("offline")
+
+        started = []
+        monkeypatch.setattr(client_module.threading.Thread, "start", lambda self: started.append(self))
+        GmailClient(access_token="tok")
+        assert started == []
+        client = make_client(handler, access_token="tok", prewarm=True)
+        assert len(started) == 1 and started[0].daemon
+        client._prewarm()  # errors are swallowed; the first real call reports them
+
+
 class TestRaiseApiError:
     """Test _raise_api_error raises GmailAPIError with correct status/message."""
 
@@ -93,47 +124,137 @@ class TestRaiseApiError:
 class TestGetHelper:
     """Test _get returns parsed JSON."""
 
-    def test_get_returns_parsed_json(self):
-        body = {"emailAddress": "test@example.com", "messagesTotal": 42}
-        transport = _make_transport(body=body)
-        client = _client_with_transport(transport)
+    def test_get_returns_parsed_json(self, make_client):
+        client = make_client(_make_handler(content=_PROFILE_BYTES))
         result = client._get("/users/me/profile")
-        assert result == body
+        assert result == _PROFILE
 
-    def test_get_returns_empty_dict_on_no_content(self):
-        transport = _make_transport(status_code=200, content=b"")
-        client = _client_with_transport(transport)
+    def test_get_returns_empty_dict_on_no_content(self, make_client):
+        client = make_client(_make_handler(status_code=200, content=b""))
         result = client._get("/users/me/profile")
         assert result == {}
 
 
+class TestDecode:
+    def test_uses_shared_json_loader(self, monkeypatch):
+        from gmail_sdk import _json
+
+        calls = []
+        monkeypatch.setattr(_json, "loads", lambda data: calls.append(data) or {"ok": True})
+        resp = httpx.Response(200, content=b'{"ok": true}')
+        assert GmailClient._decode(resp) == {"ok": True}
+        assert calls == [b'{"ok": true}']
+
+    def test_204_short_circuits_parsing(self, monkeypatch):
+        from gmail_sdk import _json
+
+        monkeypatch.setattr(_json, "loads", lambda data: pytest.fail("should not parse"))
+        assert GmailClient._decode(httpx.Response(204)) == {}
+
+    def test_decodes_utf8_bytes(self):
+        resp = httpx.Response(200, content='{"snippet": "Grüße ☕"}'.encode())
+        assert GmailClient._decode(resp) == {"snippet": "Grüße ☕"}
+
+
 class TestPostHelper:
     """Test _post returns parsed JSON (after B1 fix)."""
 
-    def test_post_returns_parsed_json(self):
+    def test_post_returns_parsed_json(self, make_client):
         body = {"id": "msg-123", "threadId": "thread-456"}
-        transport = _make_transport(body=body)
-        client = _client_with_transport(transport)
+        client = make_client(_make_handler(body=body))
         result = client._post("/users/me/messages/send", json={"raw": "abc"})
         assert result == body
 
-    def test_post_returns_empty_dict_on_no_content(self):
-        transport = _make_transport(status_code=204, content=b"")
-        client = _client_with_transport(transport)
+    def test_post_returns_empty_dict_on_no_content(self, make_client):
+        client = make_client(_make_handler(status_code=204, content=b""))
         result = client._post("/users/me/messages/batchModify", json={"ids": []})
         assert result == {}
 
+    def test_post_sends_compact_json(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        client = make_client(handler)
+        client._post("/users/me/messages/m1/modify", json={"removeLabelIds": ["UNREAD"]})
+        assert seen[0].headers["Content-Type"] == "application/json"
+        assert seen[0].content == b'{"removeLabelIds":["UNREAD"]}'
+
+    def test_post_status_skips_decoding(self, make_client):
+        client = make_client(_make_handler(content=b"not json"))
+        assert client._post_status("/users/me/threads/t1/trash") == 200
+
+    def test_trash_thread_without_body_returns_status(self, make_client):
+        client = make_client(_make_handler(body={"id": "t1"}))
+        assert client.trash_thread("t1", return_body=False) == 200
+        assert client.trash_thread("t1") == {"id": "t1"}
+
 
 class TestDeleteHelper:
     """Test _delete returns status code."""
 
-    def test_delete_returns_status_code(self):
-        transport = _make_transport(status_code=204, content=b"")
-        client = _client_with_transport(transport)
+    def test_delete_returns_status_code(self, make_client):
+        client = make_client(_make_handler(status_code=204, content=b""))
         result = client._delete("/users/me/messages/msg-123")
         assert result == 204
 
 
+class TestUnauthorizedRetry:
+    """Test that a 401 triggers one token refresh and a retry."""
+
+    def test_refreshes_and_retries_once_on_401(self, monkeypatch, make_client):
+        seen_tokens = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen_tokens.append(request.headers["Authorization"])
+            if request.headers["Authorization"] == "Bearer old-token":
+                return httpx.Response(401, json={"error": {"message": "Invalid Credentials"}})
+            return httpx.Response(200, json={"emailAddress": "test@example.com"})
+
+        client = make_client(_handler, access_token="old-token")
+        client.account = "acct"
+        refresh_calls = []
+
+        def _refresh(account, secrets_dir, stale_token=None):
+            refresh_calls.append(stale_token)
+            return "new-token"
+
+        monkeypatch.setattr(client, "_load_and_refresh_token", _refresh)
+        result = client._get("/users/me/profile")
+
+        assert result == {"emailAddress": "test@example.com"}
+        assert refresh_calls == ["old-token"]
+        assert seen_tokens == ["Bearer old-token", "Bearer new-token"]
+        assert client.access_token == "new-token"
+
+    def test_no_retry_without_account(self, make_client):
+        handler = _make_handler(status_code=401, body={"error": {"message": "Unauthorized"}})
+        client = make_client(handler, access_token="raw-token")
+        with pytest.raises(GmailAPIError) as exc_info:
+            client._get("/users/me/profile")
+        assert exc_info.value.status_code == 401
+
+
+class TestLazyRefresh:
+    def test_lazy_refresh_uses_stored_token_without_refreshing(self, tmp_path, monkeypatch):
+        from gmail_sdk.auth import AuthMixin
+
+        AuthMixin.clear_token_cache()
+        AuthMixin._save_token(
+            "acct", str(tmp_path), {"access_token": "expired", "refresh_token": "r", "expires_at": 0}
+        )
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("should not refresh eagerly")
+
+        monkeypatch.setattr(GmailClient, "_load_and_refresh_token", _fail)
+        client = GmailClient(account="acct", secrets_dir=str(tmp_path), lazy_refresh=True)
+        assert client.access_token == "expired"
+        assert client._http.headers["Authorization"] == "Bearer expired"
+
+
 class TestContextManager:
     """Test context manager calls close."""
 
@@ -156,3 +277,123 @@ class TestRepr:
     def test_repr_without_account(self):
         client = GmailClient()
         assert repr(client) == "GmailClient()"
+
+
+class TestSlots:
+    def test_constructor_state_lives_in_slots(self):
+        client = GmailClient(access_token="xxx", etag_cache_size=4)
+        assert vars(client) == {}
+        assert client._my_email is None
+
+    def test_methods_can_still_be_patched_per_instance(self):
+        client = GmailClient(access_token="xxx")
+        client.get_profile = lambda: {"emailAddress": "Me@Example.com"}
+        assert client._get_my_email() == "me@example.com"
+
+
+class TestETagCache:
+    def test_disabled_by_default(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, json={"id": "L1"}, headers={"ETag": '"v1"'})
+
+        client = make_client(handler, access_token="tok")
+        client.get_label("L1")
+        client.get_label("L1")
+        assert seen == [None, None]
+
+    def test_revalidates_and_serves_304_from_cache(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "L1", "name": "Work"}, headers={"ETag": '"v1"'})
+
+        client = make_client(handler, access_token="tok", etag_cache_size=8)
+        first = client.get_label("L1")
+        first["name"] = "mutated"
+        assert client.get_label("L1") == {"id": "L1", "name": "Work"}
+        assert seen == [None, '"v1"']
+
+    def test_params_are_part_of_the_key(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, json={"id": "m"}, headers={"ETag": '"v1"'})
+
+        client = make_client(handler, access_token="tok", etag_cache_size=8)
+        client.get_message("m", format_="raw")
+        client.get_message("m", format_="minimal")
+        assert seen == [None, None]
+
+    def test_immutable_entries_skip_the_network(self, make_client):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(
+                200,
+                json={"id": "m", "raw": "abc"},
+                headers={"ETag": '"v1"', "Cache-Control": "private, max-age=0, immutable"},
+            )
+
+        client = make_client(handler, access_token="tok", etag_cache_size=8)
+        client.get_message("m", format_="raw")
+        assert client.get_message("m", format_="raw") == {"id": "m", "raw": "abc"}
+        assert len(calls) == 1
+
+    def test_evicts_least_recently_used(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"x": 1}, headers={"ETag": '"v"'})
+
+        client = make_client(handler, access_token="tok", etag_cache_size=2)
+        for label in ("a", "b", "a", "c"):
+            client.get_label(label)
+        keys = [k[0] for k in client._etag_cache._entries]
+        assert keys == ["/users/me/labels/a", "/users/me/labels/c"]
+
+
+class TestRawMessageStreaming:
+    RAW = b"From: a@example.com\r\nSubject: big\r\n\r\n" + bytes(range(256)) * 50
+
+    def _body(self) -> bytes:
+        encoded = base64.urlsafe_b64encode(self.RAW).rstrip(b"=")
+        return b'{\n  "raw": "' + encoded + b'"\n}\n'
+
+    def test_decoder_handles_arbitrary_chunk_boundaries(self):
+        from gmail_sdk.messages import _RawFieldDecoder
+
+        body = self._body()
+        for size in (1, 3, 7, 4096):
+            decoder = _RawFieldDecoder()
+            out = b"".join(decoder.feed(body[i:i + size]) for i in range(0, len(body), size))
+            assert out + decoder.flush() == self.RAW
+
+    def test_get_message_raw_bytes_streams_and_decodes(self, make_client):
+        body = self._body()
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["params"] = dict(request.url.params)
+            return httpx.Response(200, content=iter([body[i:i + 100] for i in range(0, len(body), 100)]))
+
+        client = make_client(handler, access_token="tok")
+        assert client.get_message_raw_bytes("m1") == self.RAW
+        assert seen["params"] == {"format": "raw", "fields": "raw"}
+
+    def test_error_response_raises(self, make_client):
+        client = make_client(_make_handler(404, body={"error": {"message": "Not Found"}}), access_token="tok")
+        with pytest.raises(GmailAPIError) as exc_info:
+            client.get_message_raw_bytes("missing")
+        assert exc_info.value.status_code == 404
+
+    def test_async_iter_message_raw(self, make_async_client):
+        import asyncio
+
+        client = make_async_client(lambda request: httpx.Response(200, content=self._body()), access_token="tok")
+        assert asyncio.run(client.get_message_raw_bytes("m1")) == self.RAW
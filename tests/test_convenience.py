@@ -3,9 +3,20 @@
 from __future__ import annotations
 
 import base64
+import functools
+from email import message_from_bytes
 from unittest.mock import MagicMock, patch, call
 
-from gmail_sdk.convenience import ConvenienceMixin, _get_header, _extract_email
+from gmail_sdk.convenience import ConvenienceMixin, _get_header, _extract_email, _headers_to_dict
+
+
+def _decode_raw(raw: str):
+    return message_from_bytes(base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)))
+
+
+@functools.cache
+def _enc(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
 
 
 class TestGetHeader:
@@ -33,14 +44,33 @@ class TestGetHeader:
         assert _get_header(headers, "X-Custom") == "first"
 
 
-class TestExtractBody:
-    def _encode(self, text: str) -> str:
-        return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+class TestHeadersToDict:
+    def test_first_occurrence_wins(self):
+        headers = [
+            {"name": "Received", "value": "first"},
+            {"name": "received", "value": "second"},
+        ]
+        assert _headers_to_dict(headers) == {"received": "first"}
+
+    def test_keys_are_lowercased(self):
+        headers = [
+            {"name": "From", "value": "alice@example.com"},
+            {"name": "Message-ID", "value": "<id@example.com>"},
+        ]
+        assert _headers_to_dict(headers) == {
+            "from": "alice@example.com",
+            "message-id": "<id@example.com>",
+        }
+
+    def test_empty_headers_list(self):
+        assert _headers_to_dict([]) == {}
 
+
+class TestExtractBody:
     def test_simple_text_plain(self):
         payload = {
             "mimeType": "text/plain",
-            "body": {"data": self._encode("Hello world")},
+            "body": {"data": _enc("Hello world")},
         }
         assert ConvenienceMixin._extract_body(payload) == "Hello world"
 
@@ -51,11 +81,11 @@ class TestExtractBody:
             "parts": [
                 {
                     "mimeType": "text/plain",
-                    "body": {"data": self._encode("Plain text body")},
+                    "body": {"data": _enc("Plain text body")},
                 },
                 {
                     "mimeType": "text/html",
-                    "body": {"data": self._encode("<p>HTML body</p>")},
+                    "body": {"data": _enc("<p>HTML body</p>")},
                 },
             ],
         }
@@ -72,11 +102,11 @@ class TestExtractBody:
                     "parts": [
                         {
                             "mimeType": "text/plain",
-                            "body": {"data": self._encode("Nested plain text")},
+                            "body": {"data": _enc("Nested plain text")},
                         },
                         {
                             "mimeType": "text/html",
-                            "body": {"data": self._encode("<p>Nested HTML</p>")},
+                            "body": {"data": _enc("<p>Nested HTML</p>")},
                         },
                     ],
                 },
@@ -103,7 +133,7 @@ class TestExtractBody:
                             "parts": [
                                 {
                                     "mimeType": "text/plain",
-                                    "body": {"data": self._encode("Deep text")},
+                                    "body": {"data": _enc("Deep text")},
                                 },
                             ],
                         },
@@ -113,6 +143,35 @@ class TestExtractBody:
         }
         assert ConvenienceMixin._extract_body(payload) == "Deep text"
 
+    def test_first_match_in_document_order_wins(self):
+        payload = {
+            "mimeType": "multipart/mixed",
+            "body": {},
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "body": {},
+                    "parts": [
+                        {
+                            "mimeType": "text/plain",
+                            "body": {"data": _enc("Message body")},
+                        },
+                    ],
+                },
+                {
+                    "mimeType": "text/plain",
+                    "body": {"data": _enc("Attached notes")},
+                },
+            ],
+        }
+        assert ConvenienceMixin._extract_body(payload) == "Message body"
+
+    def test_pathological_nesting_does_not_recurse(self):
+        payload = {"mimeType": "text/plain", "body": {"data": _enc("Bottom")}}
+        for _ in range(5000):
+            payload = {"mimeType": "multipart/mixed", "body": {}, "parts": [payload]}
+        assert ConvenienceMixin._extract_body(payload) == "Bottom"
+
     def test_no_text_body(self):
         payload = {
             "mimeType": "multipart/mixed",
@@ -136,11 +195,11 @@ class TestExtractBody:
             "parts": [
                 {
                     "mimeType": "text/plain",
-                    "body": {"data": self._encode("Plain text")},
+                    "body": {"data": _enc("Plain text")},
                 },
                 {
                     "mimeType": "text/html",
-                    "body": {"data": self._encode("<p>HTML body</p>")},
+                    "body": {"data": _enc("<p>HTML body</p>")},
                 },
             ],
         }
@@ -149,7 +208,7 @@ class TestExtractBody:
     def test_extract_html_returns_none_when_missing(self):
         payload = {
             "mimeType": "text/plain",
-            "body": {"data": self._encode("Only plain")},
+            "body": {"data": _enc("Only plain")},
         }
         assert ConvenienceMixin._extract_body(payload, mime_type="text/html") is None
 
@@ -170,6 +229,12 @@ class TestExtractEmail:
     def test_empty_string(self):
         assert _extract_email("") == ""
 
+    def test_repeated_address_is_parsed_once(self):
+        _extract_email.cache_clear()
+        _extract_email("Bob <bob@example.com>")
+        _extract_email("Bob <bob@example.com>")
+        assert _extract_email.cache_info().hits == 1
+
 
 class TestMarkAsReadUnread:
     def test_mark_as_read_calls_modify(self):
@@ -187,10 +252,50 @@ class TestMarkAsReadUnread:
         assert result == {"id": "msg1"}
 
 
+class TestBatchConvenience:
+    def _client(self):
+        from gmail_sdk import GmailClient
+        client = GmailClient(access_token="tok")
+        client._post = MagicMock(return_value={})
+        return client
+
+    def test_batch_mark_as_read_chunks_at_1000(self):
+        client = self._client()
+        ids = [f"m{i}" for i in range(2500)]
+        client.batch_mark_as_read(ids)
+        calls = client._post.call_args_list
+        assert [len(c.kwargs["json"]["ids"]) for c in calls] == [1000, 1000, 500]
+        assert all(c.args == ("/users/me/messages/batchModify",) for c in calls)
+        assert all(c.kwargs["json"]["removeLabelIds"] == ["UNREAD"] for c in calls)
+        assert [i for c in calls for i in c.kwargs["json"]["ids"]] == ids
+
+    def test_batch_mark_as_unread(self):
+        client = self._client()
+        client.batch_mark_as_unread(["m1", "m2"])
+        client._post.assert_called_once_with(
+            "/users/me/messages/batchModify",
+            json={"ids": ["m1", "m2"], "addLabelIds": ["UNREAD"]},
+        )
+
+    def test_batch_archive(self):
+        client = self._client()
+        client.batch_archive(["m1"])
+        client._post.assert_called_once_with(
+            "/users/me/messages/batchModify",
+            json={"ids": ["m1"], "removeLabelIds": ["INBOX"]},
+        )
+
+    def test_empty_list_makes_no_request(self):
+        client = self._client()
+        client.batch_archive([])
+        client._post.assert_not_called()
+
+
 class TestReplyAll:
     def _make_mixin(self, headers, my_email="me@example.com"):
         """Create a ConvenienceMixin with mocked dependencies."""
         mixin = ConvenienceMixin()
+        mixin._my_email = None  # normally initialized by GmailClient.__init__
         mixin.get_message = MagicMock(return_value={
             "threadId": "thread1",
             "payload": {"headers": headers},
@@ -215,12 +320,7 @@ class TestReplyAll:
         raw = mixin.send_raw_message.call_args.kwargs["raw"]
 
         # Decode and check recipients
-        from email import message_from_bytes
-        padding = 4 - len(raw) % 4
-        if padding != 4:
-            raw += "=" * padding
-        import base64
-        msg = message_from_bytes(base64.urlsafe_b64decode(raw))
+        msg = _decode_raw(raw)
 
         # To should be From (alice), Cc should be Bob only (me excluded)
         assert msg["To"] == "Alice <alice@example.com>"
@@ -239,12 +339,7 @@ class TestReplyAll:
         mixin.reply_all("msg1", body="Reply")
 
         raw = mixin.send_raw_message.call_args.kwargs["raw"]
-        from email import message_from_bytes
-        padding = 4 - len(raw) % 4
-        if padding != 4:
-            raw += "=" * padding
-        import base64
-        msg = message_from_bytes(base64.urlsafe_b64decode(raw))
+        msg = _decode_raw(raw)
 
         # Alice is already in To, should not also be in Cc
         assert msg["Cc"] is None
@@ -261,12 +356,7 @@ class TestReplyAll:
         mixin.reply_all("msg1", body="Reply")
 
         raw = mixin.send_raw_message.call_args.kwargs["raw"]
-        from email import message_from_bytes
-        padding = 4 - len(raw) % 4
-        if padding != 4:
-            raw += "=" * padding
-        import base64
-        msg = message_from_bytes(base64.urlsafe_b64decode(raw))
+        msg = _decode_raw(raw)
 
         assert "charlie@example.com" in msg["Cc"]
         assert "dave@example.com" in msg["Cc"]
@@ -283,12 +373,7 @@ class TestReplyAll:
         mixin.reply_all("msg1", body="Reply")
 
         raw = mixin.send_raw_message.call_args.kwargs["raw"]
-        from email import message_from_bytes
-        padding = 4 - len(raw) % 4
-        if padding != 4:
-            raw += "=" * padding
-        import base64
-        msg = message_from_bytes(base64.urlsafe_b64decode(raw))
+        msg = _decode_raw(raw)
 
         # John should be in Cc with display name preserved, me excluded
         assert "john@example.com" in msg["Cc"].lower()
@@ -307,17 +392,46 @@ class TestReplyAll:
         mixin.reply_all("msg1", body="Reply")
 
         raw = mixin.send_raw_message.call_args.kwargs["raw"]
-        from email import message_from_bytes
-        padding = 4 - len(raw) % 4
-        if padding != 4:
-            raw += "=" * padding
-        import base64
-        msg = message_from_bytes(base64.urlsafe_b64decode(raw))
+        msg = _decode_raw(raw)
 
         assert msg["To"] == "reply@example.com"
         # alice (From) should be in Cc since Reply-To is different
         assert "alice@example.com" in msg["Cc"]
 
+    def test_profile_fetched_once_across_calls(self):
+        headers = [
+            {"name": "From", "value": "alice@example.com"},
+            {"name": "Subject", "value": "Test"},
+            {"name": "Message-ID", "value": "<id@example.com>"},
+        ]
+        mixin = self._make_mixin(headers, my_email="Me@Example.com")
+        mixin.reply_all("msg1", body="One")
+        mixin.reply_all("msg1", body="Two")
+        mixin.get_profile.assert_called_once_with()
+        assert mixin._my_email == "me@example.com"
+
+
+class TestForward:
+    def test_requests_only_payload_fields(self):
+        mixin = ConvenienceMixin()
+        mixin.get_message = MagicMock(return_value={
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [{"name": "Subject", "value": "Report"}],
+                "body": {"data": base64.urlsafe_b64encode(b"See attached").decode("ascii")},
+            },
+        })
+        mixin.send_raw_message = MagicMock(return_value={"id": "sent1"})
+        mixin.forward("msg1", to="bob@example.com", note="FYI")
+
+        kwargs = mixin.get_message.call_args.kwargs
+        assert kwargs["format_"] == "full"
+        assert kwargs["fields"].startswith("payload(")
+        raw = mixin.send_raw_message.call_args.kwargs["raw"]
+        msg = _decode_raw(raw)
+        assert msg["Subject"] == "Fwd: Report"
+        assert "See attached" in msg.get_payload(decode=True).decode()
+
 
 class TestBatchDeleteMessages:
     def test_calls_correct_endpoint(self):
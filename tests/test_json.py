@@ -0,0 +1,28 @@
+"""Unit tests for the JSON helpers."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+from gmail_sdk import _json
+
+
+class TestJsonHelpers:
+    def test_dumps_is_compact_and_sorted(self):
+        assert _json.dumps({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+
+    def test_roundtrip(self):
+        data = {"access_token": "tok", "expires_at": 1.5, "scopes": ["a", "b"]}
+        assert _json.loads(_json.dumps(data)) == data
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        fallback = importlib.reload(_json)
+        try:
+            assert fallback.orjson is None
+            assert fallback.dumps({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+            assert fallback.loads(b'{"a": 1}') == {"a": 1}
+        finally:
+            monkeypatch.undo()
+            importlib.reload(_json)
@@ -1,17 +1,21 @@
-"""Integration tests for labels."""
+"""Tests for labels."""
 
-from __future__ import annotations
+import pytest
 
 from gmail_sdk import GmailClient
 
 
 class TestListLabels:
-    def test_returns_labels(self, client: GmailClient):
-        result = client.list_labels()
+    def test_returns_labels(self, mock_client: GmailClient):
+        result = mock_client.list_labels()
         assert "labels" in result
         assert len(result["labels"]) > 0
 
-    def test_contains_inbox(self, client: GmailClient):
-        result = client.list_labels()
+    def test_contains_inbox(self, mock_client: GmailClient):
+        result = mock_client.list_labels()
         label_names = [l["name"] for l in result["labels"]]
         assert "INBOX" in label_names
+
+    @pytest.mark.remote
+    def test_live_contains_inbox(self, warmup: dict):
+        assert "INBOX" in [l["name"] for l in warmup["labels"]["labels"]]
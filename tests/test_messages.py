@@ -1,6 +1,4 @@
-"""Integration tests for messages."""
-
-from __future__ import annotations
+"""Tests for messages."""
 
 import pytest
 
@@ -8,20 +6,43 @@ from gmail_sdk import GmailClient
 
 
 class TestListMessages:
-    def test_returns_messages(self, client: GmailClient):
-        result = client.list_messages(max_results=5)
+    def test_returns_messages(self, mock_client: GmailClient):
+        result = mock_client.list_messages(max_results=5)
         assert "messages" in result or "resultSizeEstimate" in result
 
-    def test_with_query(self, client: GmailClient):
-        result = client.list_messages(query="is:unread", max_results=3)
+    def test_with_query(self, mock_client: GmailClient):
+        result = mock_client.list_messages(query="is:unread", max_results=3)
         # Should return without error; may or may not have messages
         assert "resultSizeEstimate" in result
 
-    def test_get_message(self, client: GmailClient):
-        listing = client.list_messages(max_results=1)
-        if not listing.get("messages"):
-            pytest.skip("empty inbox")
+    def test_get_message(self, mock_client: GmailClient):
+        listing = mock_client.list_messages(max_results=1)
         msg_id = listing["messages"][0]["id"]
-        msg = client.get_message(msg_id)
+        msg = mock_client.get_message(msg_id)
         assert "id" in msg
         assert "payload" in msg
+
+    @pytest.mark.remote
+    def test_live_get_message(self, client: GmailClient, first_message_id: str):
+        msg = client.get_message(first_message_id)
+        assert msg["id"] == first_message_id
+        assert "payload" in msg
+
+
+class TestParamBuilders:
+    def test_list_params_omits_unset_values(self):
+        from gmail_sdk.messages import _list_params
+
+        assert _list_params(None, 10, None, None, False) == {"maxResults": 10}
+        assert _list_params("is:unread", 5, ["INBOX"], "tok", True) == {
+            "maxResults": 5,
+            "q": "is:unread",
+            "labelIds": ["INBOX"],
+            "pageToken": "tok",
+            "includeSpamTrash": True,
+        }
+
+    def test_label_payload_keeps_explicit_empty_lists(self):
+        from gmail_sdk.messages import _label_payload
+
+        assert _label_payload(None, []) == {"removeLabelIds": []}
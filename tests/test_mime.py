@@ -1,10 +1,16 @@
 """Unit tests for MIME utilities."""
 
-from __future__ import annotations
-
 import base64
-from email import message_from_bytes
+import importlib
+import subprocess
+import sys
+from email.parser import BytesParser
+from email.header import decode_header, make_header
+from email.utils import parseaddr
+
+import pytest
 
+from gmail_sdk import mime_utils
 from gmail_sdk.mime_utils import (
     build_simple_message,
     build_reply_message,
@@ -13,126 +19,140 @@ from gmail_sdk.mime_utils import (
 )
 
 
+# Addresses shared by the builder tests.
+_TO = "test@example.com"
+_FROM = "sender@example.com"
+_CC = "cc@example.com"
+_MID = "<abc123@example.com>"
+
+# Padding to append, indexed by len(data) % 4.
+_PAD = (b"", b"===", b"==", b"=")
+
+
 def _b64url_decode(data: str) -> bytes:
     """Decode base64url with missing padding."""
-    padding = 4 - len(data) % 4
-    if padding != 4:
-        data += "=" * padding
-    return base64.urlsafe_b64decode(data)
+    raw = data.encode("ascii")
+    return base64.urlsafe_b64decode(raw + _PAD[len(raw) & 3])
 
 
-class TestBuildSimpleMessage:
-    def test_basic_message(self):
-        raw = build_simple_message(to="test@example.com", subject="Hello", body="Hi there")
-        # Should be valid base64url
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["To"] == "test@example.com"
-        assert msg["Subject"] == "Hello"
-        assert "Hi there" in msg.get_payload(decode=True).decode()
+_PARSER = BytesParser()
 
-    def test_with_cc_and_bcc(self):
-        raw = build_simple_message(
-            to="to@example.com",
-            subject="Test",
-            body="body",
-            cc="cc@example.com",
-            bcc="bcc@example.com",
-        )
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["Cc"] == "cc@example.com"
-        assert msg["Bcc"] == "bcc@example.com"
 
-    def test_with_from(self):
-        raw = build_simple_message(
-            to="to@example.com",
-            subject="Test",
-            body="body",
-            from_addr="sender@example.com",
-        )
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["From"] == "sender@example.com"
+def _parse(data: bytes):
+    """Parse decoded message bytes with the shared parser instead of a new one per call."""
+    return _PARSER.parsebytes(data)
+
+
+def _assert_header(decoded: bytes, name: str, value: str) -> None:
+    """Assert a header line is present without running the email parser."""
+    assert f"{name}: {value}\r\n".encode() in decoded
+
+
+class TestBuildSimpleMessage:
+    @pytest.mark.parametrize(
+        "kwargs,expected_headers",
+        [
+            (
+                dict(to=_TO, subject="Hello", body="Hi there"),
+                {"To": _TO, "Subject": "Hello"},
+            ),
+            (
+                dict(to="to@example.com", subject="Test", body="body", cc=_CC, bcc="bcc@example.com"),
+                {"Cc": _CC, "Bcc": "bcc@example.com"},
+            ),
+            (
+                dict(to="to@example.com", subject="Test", body="body", from_addr=_FROM),
+                {"From": _FROM},
+            ),
+        ],
+        ids=["basic", "cc_and_bcc", "from"],
+    )
+    def test_headers(self, kwargs, expected_headers):
+        decoded = _b64url_decode(build_simple_message(**kwargs))
+        for name, value in expected_headers.items():
+            _assert_header(decoded, name, value)
+
+    def test_basic_message_body(self):
+        raw = build_simple_message(to=_TO, subject="Hello", body="Hi there")
+        assert _b64url_decode(raw).endswith(b"\r\n\r\nHi there")
 
 
 class TestBuildReplyMessage:
-    def test_reply_has_threading_headers(self):
+    @pytest.mark.parametrize(
+        "references,expected_references",
+        [(_MID, _MID), (None, _MID)],
+        ids=["explicit_references", "defaults_to_message_id"],
+    )
+    def test_threading_headers(self, references, expected_references):
         raw = build_reply_message(
             to="original@example.com",
             subject="Re: Hello",
             body="Thanks!",
-            message_id="<abc123@example.com>",
-            references="<abc123@example.com>",
+            message_id=_MID,
+            references=references,
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["In-Reply-To"] == "<abc123@example.com>"
-        assert msg["References"] == "<abc123@example.com>"
+        _assert_header(decoded, "In-Reply-To", _MID)
+        _assert_header(decoded, "References", expected_references)
 
-    def test_reply_defaults_references_to_message_id(self):
-        raw = build_reply_message(
-            to="original@example.com",
-            subject="Re: Hello",
-            body="Thanks!",
-            message_id="<abc123@example.com>",
-        )
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["References"] == "<abc123@example.com>"
+    def test_reply_parses_as_email(self):
+        # Format canary: the stdlib parser must agree with the raw header checks.
+        raw = build_reply_message(to="original@example.com", subject="Re: Hello", body="Thanks!", message_id="<a@x>")
+        msg = _parse(_b64url_decode(raw))
+        assert msg["In-Reply-To"] == "<a@x>"
+        assert msg.get_payload(decode=True) == b"Thanks!"
 
 
 class TestBuildForwardMessage:
-    def test_forward_includes_original(self):
+    @pytest.mark.parametrize(
+        "note,expected",
+        [("FYI", ["Original content here", "FYI", "Forwarded message"]), (None, ["Original content here"])],
+        ids=["with_note", "without_note"],
+    )
+    def test_forward_includes_original(self, note, expected):
         raw = build_forward_message(
             to="fwd@example.com",
             subject="Fwd: Hello",
             original_body="Original content here",
-            note="FYI",
+            note=note,
         )
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        payload = msg.get_payload(decode=True).decode()
-        assert "Original content here" in payload
-        assert "FYI" in payload
-        assert "Forwarded message" in payload
+        payload = _parse(_b64url_decode(raw)).get_payload(decode=True).decode()
+        for text in expected:
+            assert text in payload
 
-    def test_forward_without_note(self):
-        raw = build_forward_message(
-            to="fwd@example.com",
-            subject="Fwd: Hello",
-            original_body="Original content",
-        )
-        decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        payload = msg.get_payload(decode=True).decode()
-        assert "Original content" in payload
+    def test_forward_body_layout(self):
+        raw = build_forward_message(to="fwd@example.com", subject="Fwd: Hi", original_body="orig", note="FYI")
+        msg = _parse(_b64url_decode(raw))
+        assert msg.get_payload(decode=True) == b"FYI\r\n\r\n---------- Forwarded message ----------\r\norig"
 
 
 class TestBuildSimpleMessageHTML:
     def test_html_creates_multipart_alternative(self):
         raw = build_simple_message(
-            to="test@example.com",
+            to=_TO,
             subject="HTML Test",
             body="Plain version",
             html_body="<b>HTML version</b>",
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
+        msg = _parse(decoded)
         assert msg.get_content_type() == "multipart/alternative"
         parts = msg.get_payload()
         assert len(parts) == 2
-        assert parts[0].get_content_type() == "text/plain"
-        assert "Plain version" in parts[0].get_payload(decode=True).decode()
-        assert parts[1].get_content_type() == "text/html"
-        assert "<b>HTML version</b>" in parts[1].get_payload(decode=True).decode()
+        plain_part, html_part = parts
+        assert plain_part.get_content_type() == "text/plain"
+        assert html_part.get_content_type() == "text/html"
+        # ASCII bodies are sent 7bit, so the raw payload is the text itself
+        assert plain_part["Content-Transfer-Encoding"] == html_part["Content-Transfer-Encoding"] == "7bit"
+        assert "Plain version" in plain_part.get_payload()
+        assert "<b>HTML version</b>" in html_part.get_payload()
 
     def test_plain_only_still_works(self):
-        raw = build_simple_message(to="test@example.com", subject="Plain", body="Just plain")
+        raw = build_simple_message(to=_TO, subject="Plain", body="Just plain")
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
+        msg = _parse(decoded)
         assert msg.get_content_type() == "text/plain"
-        assert "Just plain" in msg.get_payload(decode=True).decode()
+        assert "Just plain" in msg.get_payload()
 
     def test_html_message_has_headers(self):
         raw = build_simple_message(
@@ -140,15 +160,15 @@ class TestBuildSimpleMessageHTML:
             subject="HTML",
             body="plain",
             html_body="<p>html</p>",
-            cc="cc@example.com",
-            from_addr="sender@example.com",
+            cc=_CC,
+            from_addr=_FROM,
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
+        msg = _parse(decoded)
         assert msg["To"] == "to@example.com"
         assert msg["Subject"] == "HTML"
-        assert msg["Cc"] == "cc@example.com"
-        assert msg["From"] == "sender@example.com"
+        assert msg["Cc"] == _CC
+        assert msg["From"] == _FROM
 
 
 class TestBuildReplyMessageHTML:
@@ -161,7 +181,7 @@ class TestBuildReplyMessageHTML:
             html_body="<b>Thanks!</b>",
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
+        msg = _parse(decoded)
         assert msg.get_content_type() == "multipart/alternative"
         assert msg["In-Reply-To"] == "<abc@example.com>"
         parts = msg.get_payload()
@@ -173,11 +193,11 @@ class TestBuildReplyMessageHTML:
             subject="Re: Test",
             body="body",
             message_id="<id@example.com>",
-            cc="cc@example.com",
+            cc=_CC,
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
-        assert msg["Cc"] == "cc@example.com"
+        msg = _parse(decoded)
+        assert msg["Cc"] == _CC
 
 
 class TestBuildForwardMessageHTML:
@@ -189,21 +209,19 @@ class TestBuildForwardMessageHTML:
             html_body="<p>Forwarded HTML</p>",
         )
         decoded = _b64url_decode(raw)
-        msg = message_from_bytes(decoded)
+        msg = _parse(decoded)
         assert msg.get_content_type() == "multipart/alternative"
         parts = msg.get_payload()
         assert len(parts) == 2
-        plain = parts[0].get_payload(decode=True).decode()
-        assert "Original" in plain
-        html = parts[1].get_payload(decode=True).decode()
-        assert "<p>Forwarded HTML</p>" in html
+        assert "Original" in parts[0].get_payload()
+        assert "<p>Forwarded HTML</p>" in parts[1].get_payload()
 
 
 class TestEncodeMessage:
     def test_base64url_encoding(self):
         from email.mime.text import MIMEText
         msg = MIMEText("test body")
-        msg["To"] = "test@example.com"
+        msg["To"] = _TO
         msg["Subject"] = "Test"
         encoded = encode_message(msg)
         # Should not contain trailing padding
@@ -211,3 +229,110 @@ class TestEncodeMessage:
         # Should decode without errors
         decoded = _b64url_decode(encoded)
         assert b"test body" in decoded
+
+    def test_accepts_raw_bytes(self):
+        raw = b"To: a@example.com\r\n\r\n\xfb\xff body"
+        encoded = encode_message(raw)
+        assert encoded == base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+        assert "+" not in encoded and "/" not in encoded
+        assert _b64url_decode(encoded) == raw
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 5])
+    def test_padding_stripped_for_every_length(self, size):
+        raw = b"\xfb" * size
+        assert encode_message(raw) == base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def test_binascii_fallback_matches(self, monkeypatch):
+        raw = bytes(range(256)) * 3
+        expected = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+        monkeypatch.setitem(sys.modules, "pybase64", None)
+        fallback = importlib.reload(mime_utils)
+        try:
+            assert fallback.pybase64 is None
+            assert fallback.encode_message(raw) == expected
+            assert fallback._encode_lines(raw) == base64.encodebytes(raw)
+            assert fallback._decode_b64url(base64.urlsafe_b64encode(raw)) == raw
+            assert fallback._decode_b64url(expected) == raw
+            assert fallback._decode_b64url("aGk") == b"hi"
+        finally:
+            monkeypatch.undo()
+            importlib.reload(mime_utils)
+        assert mime_utils.encode_message(raw) == expected
+        assert mime_utils._decode_b64url(expected) == raw
+
+
+class TestBuildRaw:
+    def test_uses_crlf_and_7bit_for_ascii(self):
+        raw = _b64url_decode(build_simple_message(to="a@example.com", subject="Hi", body="line1\nline2"))
+        head, _, body = raw.partition(b"\r\n\r\n")
+        assert b"Content-Transfer-Encoding: 7bit" in head
+        assert body == b"line1\r\nline2"
+
+    def test_bare_cr_becomes_crlf_in_7bit_body(self):
+        raw = _b64url_decode(build_simple_message(to="a@example.com", subject="Hi", body="a\rb\r\nc\n"))
+        head, _, body = raw.partition(b"\r\n\r\n")
+        assert b"Content-Transfer-Encoding: 7bit" in head
+        assert body == b"a\r\nb\r\nc\r\n"
+
+    def test_non_ascii_subject_and_body_round_trip(self):
+        raw = build_simple_message(to="a@example.com", subject="Café ☕", body="Grüße")
+        msg = _parse(_b64url_decode(raw))
+        assert str(make_header(decode_header(msg["Subject"]))) == "Café ☕"
+        assert msg["Content-Transfer-Encoding"] == "base64"
+        assert msg.get_payload(decode=True).decode("utf-8") == "Grüße"
+
+    def test_non_ascii_display_name_keeps_address(self):
+        raw = build_simple_message(to="José <jose@example.com>", subject="Hi", body="x")
+        msg = _parse(_b64url_decode(raw))
+        name, addr = parseaddr(str(make_header(decode_header(msg["To"]))))
+        assert (name, addr) == ("José", "jose@example.com")
+
+    def test_long_ascii_line_uses_base64(self):
+        raw = build_simple_message(to="a@example.com", subject="Hi", body="x" * 2000)
+        msg = _parse(_b64url_decode(raw))
+        assert msg["Content-Transfer-Encoding"] == "base64"
+        assert msg.get_payload(decode=True) == b"x" * 2000
+
+    def test_rejects_header_injection(self):
+        with pytest.raises(ValueError):
+            build_simple_message(to="a@example.com", subject="Hi\r\nBcc: evil@example.com", body="x")
+
+    def test_long_references_header_is_folded(self):
+        references = " ".join(f"<msg{i}.abcdefghijkl@mail.gmail.com>" for i in range(40))
+        raw = build_reply_message(to="a@example.com", subject="Re: Hi", body="ok", message_id=_MID, references=references)
+        head = _b64url_decode(raw).partition(b"\r\n\r\n")[0]
+        assert all(len(line) <= 998 for line in head.split(b"\r\n"))
+        assert _parse(head + b"\r\n\r\n")["References"].split() == references.split()
+
+    @pytest.mark.parametrize(
+        "subject",
+        ["x" * 200, "x" * 200 + " tail", "Re: " + "x" * 200],
+        ids=["single_word", "long_first_word", "long_last_word"],
+    )
+    def test_long_word_is_not_split_or_left_on_empty_line(self, subject):
+        raw = build_simple_message(to="a@example.com", subject=subject, body="x")
+        head = _b64url_decode(raw).partition(b"\r\n\r\n")[0]
+        lines = head.split(b"\r\n")
+        assert b"Subject: " + subject.split(" ")[0].encode() in lines
+        assert all(line.strip() for line in lines)
+        assert _parse(head + b"\r\n\r\n")["Subject"].replace("\r\n", "") == subject
+
+    def test_rejects_word_over_line_limit(self):
+        with pytest.raises(ValueError):
+            build_simple_message(to="a@example.com", subject="x" * 1000, body="x")
+
+
+class TestImportCost:
+    def test_importing_sdk_does_not_load_email_mime(self):
+        code = "import sys, gmail_sdk; print(any(m.startswith('email.mime') for m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_building_messages_bypasses_email_generator(self):
+        code = (
+            "import sys; from gmail_sdk.mime_utils import build_simple_message; "
+            "build_simple_message(to='a@example.com', subject='Hi', body='x', html_body='<b>x</b>'); "
+            "print(any(m.startswith(('email.mime', 'email.generator')) for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -1,18 +1,22 @@
-"""Integration tests for getProfile."""
+"""Tests for getProfile."""
 
-from __future__ import annotations
+import pytest
 
 from gmail_sdk import GmailClient
 
 
 class TestGetProfile:
-    def test_returns_email_address(self, client: GmailClient):
-        profile = client.get_profile()
+    def test_returns_email_address(self, mock_client: GmailClient):
+        profile = mock_client.get_profile()
         assert "emailAddress" in profile
         assert "@" in profile["emailAddress"]
 
-    def test_returns_message_counts(self, client: GmailClient):
-        profile = client.get_profile()
+    def test_returns_message_counts(self, mock_client: GmailClient):
+        profile = mock_client.get_profile()
         assert "messagesTotal" in profile
         assert "threadsTotal" in profile
         assert isinstance(profile["messagesTotal"], int)
+
+    @pytest.mark.remote
+    def test_live_profile(self, warmup: dict):
+        assert "@" in warmup["profile"]["emailAddress"]
@@ -0,0 +1,39 @@
+"""Unit tests for the as_objects list views."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from gmail_sdk import DraftRef, LabelRef, MessageRef
+
+
+@pytest.fixture
+def client_for(make_client):
+    """Build a client whose every request is answered with body."""
+    return lambda body: make_client(lambda request: httpx.Response(200, json=body), access_token="tok")
+
+
+class TestAsObjects:
+    def test_list_messages_keeps_page_token(self, client_for):
+        page = client_for({"messages": [{"id": "m1", "threadId": "t1"}], "nextPageToken": "n"}).list_messages(
+            as_objects=True
+        )
+        assert page["messages"] == [MessageRef("m1", "t1")]
+        assert page["messages"][0].thread_id == "t1"
+        assert page["nextPageToken"] == "n"
+
+    def test_list_messages_default_is_dicts(self, client_for):
+        page = client_for({"messages": [{"id": "m1", "threadId": "t1"}]}).list_messages()
+        assert page["messages"] == [{"id": "m1", "threadId": "t1"}]
+
+    def test_empty_page_has_no_messages_key(self, client_for):
+        assert client_for({"resultSizeEstimate": 0}).list_messages(as_objects=True) == {"resultSizeEstimate": 0}
+
+    def test_list_drafts(self, client_for):
+        body = {"drafts": [{"id": "d1", "message": {"id": "m1", "threadId": "t1"}}]}
+        assert client_for(body).list_drafts(as_objects=True)["drafts"] == [DraftRef("d1", "m1", "t1")]
+
+    def test_list_labels(self, client_for):
+        body = {"labels": [{"id": "INBOX", "name": "INBOX", "type": "system"}]}
+        assert client_for(body).list_labels(as_objects=True)["labels"] == [LabelRef("INBOX", "INBOX", "system")]
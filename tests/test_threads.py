@@ -1,22 +1,116 @@
-"""Integration tests for threads."""
-
-from __future__ import annotations
+"""Tests for threads."""
 
+import httpx
 import pytest
 
 from gmail_sdk import GmailClient
 
 
 class TestListThreads:
-    def test_returns_threads(self, client: GmailClient):
-        result = client.list_threads(max_results=5)
+    def test_returns_threads(self, mock_client: GmailClient):
+        result = mock_client.list_threads(max_results=5)
         assert "threads" in result or "resultSizeEstimate" in result
 
-    def test_get_thread(self, client: GmailClient):
-        listing = client.list_threads(max_results=1)
-        if not listing.get("threads"):
-            pytest.skip("empty inbox")
+    def test_get_thread(self, mock_client: GmailClient):
+        listing = mock_client.list_threads(max_results=1)
         thread_id = listing["threads"][0]["id"]
-        thread = client.get_thread(thread_id)
+        thread = mock_client.get_thread(thread_id)
         assert "id" in thread
         assert "messages" in thread
+
+    @pytest.mark.remote
+    def test_live_get_thread(self, client: GmailClient, first_thread_id: str):
+        thread = client.get_thread(first_thread_id)
+        assert thread["id"] == first_thread_id
+        assert "messages" in thread
+
+
+class TestListThreadsParams:
+    def test_only_set_params_are_sent(self, make_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params.multi_items())
+            return httpx.Response(200, json={"threads": []})
+
+        client = make_client(handler, access_token="tok")
+        client.list_threads()
+        client.list_threads(query="is:unread", label_ids=["INBOX", "UNREAD"], page_token="p", include_spam_trash=True)
+        assert seen[0] == [("maxResults", "10")]
+        assert seen[1] == [
+            ("maxResults", "10"),
+            ("q", "is:unread"),
+            ("labelIds", "INBOX"),
+            ("labelIds", "UNREAD"),
+            ("pageToken", "p"),
+            ("includeSpamTrash", "true"),
+        ]
+
+
+class TestThreadCache:
+    def _client(self, make_client, calls: list) -> GmailClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            return httpx.Response(200, json={"id": "t1", "n": len(calls)})
+
+        return make_client(handler, access_token="tok")
+
+    def test_off_by_default(self, make_client):
+        calls = []
+        client = self._client(make_client, calls)
+        client.get_thread("t1")
+        client.get_thread("t1")
+        assert len(calls) == 2
+
+    def test_hit_skips_network_per_format(self, make_client):
+        calls = []
+        client = self._client(make_client, calls)
+        first = client.get_thread("t1", use_cache=True)
+        assert client.get_thread("t1", use_cache=True) == first
+        client.get_thread("t1", format_="minimal", use_cache=True)
+        assert len(calls) == 2
+
+    def test_hits_are_independent_copies(self, make_client):
+        calls = []
+        client = self._client(make_client, calls)
+        thread = client.get_thread("t1", use_cache=True)
+        thread.pop("n")
+        thread["labelIds"] = ["TRASH"]
+        assert client.get_thread("t1", use_cache=True) == {"id": "t1", "n": 1}
+        assert len(calls) == 1
+
+    def test_mutation_invalidates(self, make_client):
+        calls = []
+        client = self._client(make_client, calls)
+        client.get_thread("t1", use_cache=True)
+        client.get_thread("t1", format_="minimal", use_cache=True)
+        client.modify_thread("t1", add_label_ids=["STARRED"])
+        assert client._thread_cache == {}
+        client.get_thread("t1", use_cache=True)
+        assert [m for m, _ in calls] == ["GET", "GET", "POST", "GET"]
+
+    def test_evicts_least_recently_used(self, monkeypatch, make_client):
+        from gmail_sdk import threads
+
+        monkeypatch.setattr(threads, "THREAD_CACHE_SIZE", 2)
+        client = self._client(make_client, [])
+        for tid in ("a", "b", "a", "c"):
+            client.get_thread(tid, use_cache=True)
+        assert [k[0] for k in client._thread_cache] == ["a", "c"]
+
+
+class TestIterThreadItems:
+    def test_yields_items_across_chunk_boundaries(self, make_client):
+        pytest.importorskip("ijson")
+        body = (
+            b'{"id":"t1","messages":[{"id":"m1","payload":{"headers":[{"name":"Subject","value":"Hi"}]}},'
+            b'{"id":"m2","payload":{"headers":[{"name":"Subject","value":"Re: Hi"}]}}]}'
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=iter([body[i : i + 7] for i in range(0, len(body), 7)]))
+
+        client = make_client(handler, access_token="tok")
+        headers = client.iter_thread_items("t1", "messages.item.payload.headers", format_="metadata")
+        assert [h[0]["value"] for h in headers] == ["Hi", "Re: Hi"]
+        assert [m["id"] for m in client.iter_thread_items("t1")] == ["m1", "m2"]